@@ -0,0 +1,22 @@
+import importlib
+
+# Public names and the submodule defining them; loaded on first access (PEP 562)
+_EXPORTS = {
+    'ProjectBundler': '.core',
+    'PythonManager': '.utils',
+    'StylePrinter': '.utils',
+    'ScriptGenerator': '.gens',
+    'FolderSink': '.sinks',
+    'ZipSink': '.sinks',
+    'TarSink': '.sinks',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -1,18 +1,89 @@
 import os
 import re
+import json
 import shutil
+import hashlib
+import tarfile
 import zipfile
 import tomllib
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from .utils import StylePrinter, PythonManager
+from .utils import PRINTER, PythonManager
 from .gens import ScriptGenerator
+from .sinks import COPY_WORKERS, FolderSink, TarSink, ZipSink, _walk_files
 from .icon import DEFAULT_ICON_BASE64
 
-# Import Pillow for image conversion (required dependency)
-from PIL import Image
 import base64
 import io
 
+# Unlinks are metadata-bound and release the GIL, so deletions overlap well on SSDs
+REMOVE_WORKERS = 16
+
+
+def _fast_rmtree(path, ignore_errors=False):
+    """Remove a directory tree, unlinking files on a thread pool"""
+    files, dirs = [], []
+    for root, dirnames, filenames in os.walk(path, topdown=False):
+        for name in dirnames:
+            # Links to directories are removed as links, never followed
+            (files if os.path.islink(os.path.join(root, name)) else dirs).append(os.path.join(root, name))
+        files.extend(os.path.join(root, name) for name in filenames)
+    dirs.append(os.fspath(path))
+    
+    def remove(remover, target):
+        try:
+            remover(target)
+        except OSError:
+            if not ignore_errors:
+                raise
+    
+    with ThreadPoolExecutor(max_workers=REMOVE_WORKERS) as executor:
+        list(executor.map(lambda file_path: remove(os.unlink, file_path), files))
+    # Bottom-up walk order guarantees children are gone before their parents
+    for dir_path in dirs:
+        remove(os.rmdir, dir_path)
+
+
+# Windows has no allocation-only call here: truncate() extends a file by writing zeros,
+# which would double the archive's write I/O, so preallocation only runs with posix_fallocate
+CAN_PREALLOCATE = hasattr(os, 'posix_fallocate')
+
+
+def _preallocate(f, size):
+    """Reserve size bytes for an output file up front to limit fragmentation; best effort"""
+    if not CAN_PREALLOCATE:
+        return
+    try:
+        os.posix_fallocate(f.fileno(), 0, size)
+    except OSError:
+        pass
+
+
+def _hash_file(file_path):
+    """BLAKE2b digest of a file's contents, read in 1 MiB chunks"""
+    digest = hashlib.blake2b()
+    with open(file_path, 'rb') as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _pywest_version():
+    """Installed pywest version, so upgrading pywest invalidates existing bundles"""
+    from importlib.metadata import PackageNotFoundError, version
+    try:
+        return version('pywest')
+    except PackageNotFoundError:
+        return None
+
+
+def _bundle_in_worker(bundler_args, project_name, bundle_type, force):
+    """Bundle a single project inside a worker process"""
+    bundler = ProjectBundler(*bundler_args)
+    return bundler.bundle_project(project_name, bundle_type, force=force)
+
+
 class ProjectBundler:
     """Main project bundler class"""
     
@@ -20,19 +91,24 @@ class ProjectBundler:
     EXCLUDE_PATTERNS = {'.git', '__pycache__', '.pytest_cache', 'dist', 'build', '.venv', 'venv'}
     SUPPORTED_IMAGE_FORMATS = {'.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.gif'}
     ICON_SIZE = (256, 256)  # Standard icon size
+    ZIP_SIZE_RATIO = 0.6  # Rough deflate ratio for Python code and wheels, used to preallocate
+    BUNDLE_EXTENSIONS = {'folder': '', 'zip': '.zip', 'zstd': '.tar.zst'}
     
-    def __init__(self, python_version=None, compression_level=None):
+    def __init__(self, python_version=None, compression_level=None, compression_workers=None):
         self.python_version = python_version or PythonManager.DEFAULT_VERSION
-        self.compression_level = compression_level or self.DEFAULT_COMPRESSION
+        self.compression_level = self.DEFAULT_COMPRESSION if compression_level is None else compression_level
+        self.compression_workers = compression_workers
         
         # Validate settings
         if self.python_version not in PythonManager.SUPPORTED_VERSIONS:
             raise ValueError(f"Unsupported Python version: {self.python_version}")
         if not (0 <= self.compression_level <= 9):
             raise ValueError(f"Compression level must be between 0-9, got: {self.compression_level}")
+        if self.compression_workers is not None and self.compression_workers < 1:
+            raise ValueError(f"Compression workers must be at least 1, got: {self.compression_workers}")
         
         # Initialize components
-        self.printer = StylePrinter()
+        self.printer = PRINTER
         self.python_manager = PythonManager()
         self.script_generator = ScriptGenerator()
 
@@ -47,8 +123,11 @@ class ProjectBundler:
         name = name.strip('_')
         return name
     
-    def _resize_image_to_icon(self, image_path, output_path):
-        """Resize and convert image to 256x256 ICO format using Pillow"""
+    def _resize_image_to_icon(self, image_path):
+        """Resize and convert image to 256x256 ICO bytes using Pillow"""
+        # Pillow is a required dependency, imported lazily to keep CLI startup fast
+        from PIL import Image
+        
         try:
             with Image.open(image_path) as img:
                 # Convert to RGBA if necessary (ICO format supports transparency)
@@ -59,13 +138,17 @@ class ProjectBundler:
                 resized_img = img.resize(self.ICON_SIZE, Image.Resampling.LANCZOS)
                 
                 # Save as ICO with 256x256 size
-                resized_img.save(output_path, format='ICO', sizes=[self.ICON_SIZE])
+                output = io.BytesIO()
+                resized_img.save(output, format='ICO', sizes=[self.ICON_SIZE])
+                return output.getvalue()
                 
         except Exception as e:
             raise Exception(f"Failed to convert image to 256x256 ICO format: {str(e)}")
     
-    def _generate_default_icon_256x256(self, output_path):
-        """Generate 256x256 default icon from base64 constant"""
+    def _generate_default_icon_256x256(self):
+        """Generate 256x256 default icon bytes from base64 constant"""
+        from PIL import Image
+        
         try:
             # Decode base64 icon data
             icon_data = base64.b64decode(DEFAULT_ICON_BASE64)
@@ -80,7 +163,9 @@ class ProjectBundler:
                 resized_img = img.resize(self.ICON_SIZE, Image.Resampling.LANCZOS)
                 
                 # Save as ICO
-                resized_img.save(output_path, format='ICO', sizes=[self.ICON_SIZE])
+                output = io.BytesIO()
+                resized_img.save(output, format='ICO', sizes=[self.ICON_SIZE])
+                return output.getvalue()
                 
         except Exception as e:
             # Fallback: create a simple colored 256x256 icon
@@ -98,7 +183,9 @@ class ProjectBundler:
                         img.putpixel((i, y), (255, 255, 255, 255))
                         img.putpixel((self.ICON_SIZE[0] - 1 - i, y), (255, 255, 255, 255))
                 
-                img.save(output_path, format='ICO', sizes=[self.ICON_SIZE])
+                output = io.BytesIO()
+                img.save(output, format='ICO', sizes=[self.ICON_SIZE])
+                return output.getvalue()
                 
             except Exception as fallback_e:
                 raise Exception(f"Failed to generate default 256x256 icon: {str(e)}, fallback error: {str(fallback_e)}")
@@ -166,9 +253,12 @@ class ProjectBundler:
             'data': data  # Return full data for later use
         }
     
-    def bundle_project(self, project_name, bundle_type='folder', bundle_name=None):
-        """Main entry point for project bundling"""
+    def bundle_project(self, project_name, bundle_type='folder', bundle_name=None, force=False):
+        """Main entry point for project bundling; force overwrites an existing bundle"""
         try:
+            if bundle_type not in self.BUNDLE_EXTENSIONS:
+                raise ValueError(f"Unsupported bundle type: {bundle_type}")
+            
             # Validate project directory first
             project_path = self._validate_project(project_name)
             
@@ -181,22 +271,39 @@ class ProjectBundler:
             # Sanitize bundle name
             bundle_name = self._sanitize_bundle_name(bundle_name or f"{project_path.name}_bundle")
             
-            # Create bundle
-            bundle_path = self._create_bundle(project_path, config, bundle_name)
-            
-            if bundle_path is None:
-                return None
-            
-            # Create archive if requested
-            if bundle_type == 'zip':
-                return self._create_zip_archive(bundle_path, bundle_name)
-            
-            return bundle_path
+            # Create bundle, streaming straight into the archive for zip bundles
+            return self._create_bundle(project_path, config, bundle_name, bundle_type, force)
             
         except Exception as e:
             self.printer.error(f"Bundle creation failed: {str(e)}")
             raise
     
+    def bundle_projects(self, project_names, bundle_type='folder', max_workers=None, force=False):
+        """Bundle several projects concurrently, returning {project_name: bundle path or None}"""
+        # Build the Python environment template once so every worker only copies it
+        if self.python_manager.use_cache:
+            try:
+                self.python_manager.prepare_template(self.python_version)
+            except Exception as e:
+                self.printer.error(f"Failed to prepare Python {self.python_version}: {str(e)}")
+                return {project_name: None for project_name in project_names}
+        
+        bundler_args = (self.python_version, self.compression_level, self.compression_workers)
+        results = {}
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_bundle_in_worker, bundler_args, project_name, bundle_type, force): project_name
+                for project_name in project_names
+            }
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except Exception:
+                    # The worker already reported the failure
+                    results[futures[future]] = None
+        
+        return results
+    
     def _validate_project(self, project_path):
         """Validate project directory exists and is accessible"""
         project_path = Path(project_path).resolve()
@@ -234,45 +341,102 @@ class ProjectBundler:
         
         return config
     
-    def _create_bundle(self, project_path, config, bundle_name):
-        """Create complete bundle folder"""
+    def _create_bundle(self, project_path, config, bundle_name, bundle_type='folder', force=False):
+        """Create complete bundle as a folder, ZIP or .tar.zst archive"""
+        output_path = project_path.parent / f"{bundle_name}{self.BUNDLE_EXTENSIONS[bundle_type]}"
+        
         # Print header
         self.printer.print_banner()
         self.printer.print_project_info(
             config['name'], 
-            project_path.parent / bundle_name,
+            output_path,
             len(config['dependencies'])
         )
         
-        # Create bundle directory
-        bundle_dir = self._create_bundle_directory(project_path.parent, bundle_name)
-        if bundle_dir is None:
+        config['dependencies'].append("pyweste")
+        
+        # Unchanged inputs keep the existing bundle; --force always rebuilds
+        manifest_path = self._manifest_path(output_path, bundle_type)
+        # Listed once: the signature hashes these files and the build compiles their sources
+        project_files = self._project_files(project_path)
+        signature = self._bundle_signature(config, bundle_type, project_files)
+        if not force and output_path.exists() and self._read_manifest(manifest_path) == signature:
+            self.printer.success(f"Bundle is up to date: {output_path}")
+            return output_path
+        
+        # Drop the old manifest only when the builder will replace the bundle: an interrupted
+        # rebuild must never look up to date, but a refused overwrite keeps the old bundle valid
+        if force or not output_path.exists():
+            manifest_path.unlink(missing_ok=True)
+        
+        builders = {
+            'folder': self._create_folder_bundle,
+            'zip': self._create_zip_bundle,
+            'zstd': self._create_zstd_bundle,
+        }
+        result = builders[bundle_type](project_path, config, project_files, output_path, bundle_name, force)
+        
+        manifest_path.write_text(json.dumps({'signature': signature}))
+        return result
+    
+    def _manifest_path(self, output_path, bundle_type):
+        """Folder bundles carry their manifest inside, archives keep it alongside"""
+        if bundle_type == 'folder':
+            return output_path / ".pywest-manifest.json"
+        return output_path.with_name(f"{output_path.name}.manifest")
+    
+    def _read_manifest(self, manifest_path):
+        """Return the signature stored in a manifest, or None if missing or unreadable"""
+        try:
+            return json.loads(manifest_path.read_text())['signature']
+        except (OSError, ValueError, KeyError, TypeError):
             return None
+    
+    def _bundle_signature(self, config, bundle_type, project_files):
+        """Hash the settings and project files that determine a bundle's contents"""
+        digest = hashlib.blake2b()
+        digest.update(json.dumps({
+            'pywest': _pywest_version(),
+            'python': self.python_version,
+            'bundle_type': bundle_type,
+            'compression': self.compression_level,
+            'config': config,
+        }, sort_keys=True).encode())
+        
+        # hashlib releases the GIL on large buffers, so files hash in parallel
+        with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+            paths = [path for _, path in project_files]
+            for (relative, _), file_digest in zip(project_files, executor.map(_hash_file, paths)):
+                digest.update(relative.encode() + b'\0' + file_digest)
+        return digest.hexdigest()
+    
+    def _project_files(self, project_path):
+        """List (relative path, path) for every project file _copy_project_files considers"""
+        files = []
+        with os.scandir(project_path) as entries:
+            for entry in sorted(entries, key=lambda entry: entry.name):
+                if entry.name in self.EXCLUDE_PATTERNS:
+                    continue
+                if entry.is_dir():
+                    ignore = shutil.ignore_patterns('*.pyc', '__pycache__')
+                    files.extend(
+                        (f"{entry.name}/{relative}", sub.path) for sub, relative in _walk_files(entry.path, ignore)
+                    )
+                else:
+                    files.append((entry.name, entry.path))
+        return files
+    
+    def _create_folder_bundle(self, project_path, config, project_files, output_path, bundle_name, force=False):
+        """Create bundle folder next to the project"""
+        # Create bundle directory
+        bundle_dir = self._create_bundle_directory(output_path.parent, bundle_name, force)
         
-        config['dependencies'].append("pyweste")
-
         try:
-            # Setup Python environment
+            # Setup Python environment directly in the bundle
             bin_dir = bundle_dir / "bin"
-            self.python_manager.setup_environment(
-                self.python_version, bin_dir, config['dependencies']
-            )
-            
-            # Copy project files (excluding icon to prevent duplication)
-            self._copy_project_files(project_path, bundle_dir, config.get('icon'))
+            self.python_manager.setup_environment(self.python_version, bin_dir)
             
-            # Copy pyproject.toml to bin folder
-            pyproject_source = project_path / "pyproject.toml"
-            pyproject_dest = bin_dir / "pyproject.toml"
-            shutil.copy2(pyproject_source, pyproject_dest)
-
-            # Handle icon - always create 256x256 icon.ico in bin folder
-            icon_dest = bin_dir / "icon.ico"
-            self._process_icon(project_path, config, icon_dest)
-            
-            # Create scripts
-            self.script_generator.create_run_script(bundle_dir, config['entry_point'], config['name'])
-            self.script_generator.create_setup_script(bundle_dir, config['name'])
+            self._write_contents_while_installing(project_path, config, project_files, bin_dir, FolderSink(bundle_dir))
             
             # Print completion info
             self.printer.print_completion_info(bundle_dir, "folder")
@@ -283,8 +447,145 @@ class ProjectBundler:
             self._cleanup_bundle(bundle_dir)
             raise Exception(f"Bundle creation failed: {str(e)}")
     
-    def _process_icon(self, project_path, config, icon_dest):
-        """Process icon - either from config or generate default, always 256x256"""
+    def _create_zip_bundle(self, project_path, config, project_files, archive_path, bundle_name, force=False):
+        """Create ZIP bundle, streaming files into the archive without an intermediate folder"""
+        archive_file = self._create_archive_file(archive_path, force, "ZIP file")
+        
+        try:
+            compression_method, compress_level = self._get_zip_compression()
+            
+            # pip has to run the embedded interpreter, so only bin/ is staged on disk
+            staging_dir = Path(tempfile.mkdtemp(prefix="pywest_"))
+            try:
+                bin_dir = staging_dir / "bin"
+                self.python_manager.setup_environment(self.python_version, bin_dir, link=True)
+                
+                with archive_file as f:
+                    with zipfile.ZipFile(
+                        f, 'w', compression_method,
+                        compresslevel=compress_level, strict_timestamps=False
+                    ) as zipf:
+                        sink = ZipSink(zipf, bundle_name, self.compression_workers)
+                        self._write_contents_while_installing(project_path, config, project_files, bin_dir, sink)
+                        
+                        # Dependencies are installed by now, so bin/ is the bulk of what is left;
+                        # reserve the rest of the archive and truncate the unused tail afterwards
+                        if CAN_PREALLOCATE:
+                            ratio = 1.0 if compression_method == zipfile.ZIP_STORED else self.ZIP_SIZE_RATIO
+                            bin_size = sum(entry.stat().st_size for entry, _ in _walk_files(bin_dir))
+                            _preallocate(f, f.tell() + int(ratio * bin_size))
+                        sink.add_tree(bin_dir, "bin")
+                    f.truncate()
+            finally:
+                _fast_rmtree(staging_dir, ignore_errors=True)
+            
+            # Print completion info
+            archive_size = archive_path.stat().st_size
+            self.printer.print_completion_info(
+                archive_path, "zip", archive_size, self.compression_level
+            )
+            
+            return archive_path
+            
+        except Exception as e:
+            archive_file.close()
+            archive_path.unlink(missing_ok=True)
+            raise Exception(f"ZIP creation failed: {str(e)}")
+    
+    def _create_zstd_bundle(self, project_path, config, project_files, archive_path, bundle_name, force=False):
+        """Create .tar.zst bundle, compressing the tar stream with zstd on all cores"""
+        try:
+            import zstandard
+        except ImportError:
+            raise Exception("Zstandard bundles require the zstandard package: pip install zstandard")
+        
+        archive_file = self._create_archive_file(archive_path, force, "Archive")
+        
+        try:
+            # threads=-1 lets zstd compress independent blocks on every core
+            compressor = zstandard.ZstdCompressor(level=self._get_zstd_level(), threads=-1)
+            
+            # pip has to run the embedded interpreter, so only bin/ is staged on disk
+            staging_dir = Path(tempfile.mkdtemp(prefix="pywest_"))
+            try:
+                bin_dir = staging_dir / "bin"
+                self.python_manager.setup_environment(self.python_version, bin_dir, link=True)
+                
+                with archive_file as f, compressor.stream_writer(f) as stream:
+                    with tarfile.open(fileobj=stream, mode='w|') as tar:
+                        sink = TarSink(tar, bundle_name)
+                        self._write_contents_while_installing(project_path, config, project_files, bin_dir, sink)
+                        sink.add_tree(bin_dir, "bin")
+            finally:
+                _fast_rmtree(staging_dir, ignore_errors=True)
+            
+            # Print completion info
+            archive_size = archive_path.stat().st_size
+            self.printer.print_completion_info(
+                archive_path, "zstd", archive_size, self.compression_level
+            )
+            
+            return archive_path
+            
+        except Exception as e:
+            archive_file.close()
+            archive_path.unlink(missing_ok=True)
+            raise Exception(f"Zstandard archive creation failed: {str(e)}")
+    
+    def _create_archive_file(self, archive_path, force, label):
+        """Open a new archive for writing, replacing an existing one only when forced"""
+        try:
+            # Exclusive mode checks and creates in one call, so nothing can appear in between
+            return open(archive_path, 'w+b' if force else 'x+b')
+        except FileExistsError:
+            raise FileExistsError(f"{label} already exists: {archive_path}. Use --force to overwrite it")
+    
+    def _write_contents_while_installing(self, project_path, config, project_files, bin_dir, sink):
+        """Write project files into the sink while pip installs dependencies into bin_dir"""
+        # pip only adds packages under bin/, disjoint from everything the sink writes
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            installing = executor.submit(
+                self.python_manager.install_dependencies, bin_dir / "python.exe", config['dependencies']
+            )
+            self._write_bundle_contents(project_path, config, sink)
+            self._compile_project(project_path, project_files, bin_dir, sink)
+            installing.result()
+    
+    def _compile_project(self, project_path, project_files, bin_dir, sink):
+        """Ship .pyc files for the project so the first launch skips compiling it"""
+        sources = [relative for relative, _ in project_files if relative.endswith('.py')]
+        if not sources:
+            return
+        
+        pyc_root = Path(tempfile.mkdtemp(prefix="pywest_pyc_"))
+        try:
+            if not self.python_manager.compile_sources(bin_dir / "python.exe", project_path, sources, pyc_root):
+                # Sources still run without caches, just compiled on first import
+                self.printer.warning("Could not precompile project sources")
+                return
+            with os.scandir(pyc_root) as entries:
+                for entry in entries:
+                    sink.add_tree(entry.path, entry.name)
+        finally:
+            _fast_rmtree(pyc_root, ignore_errors=True)
+    
+    def _write_bundle_contents(self, project_path, config, sink):
+        """Write project files, config, icon and scripts into the bundle sink"""
+        # Copy project files (excluding icon to prevent duplication), pyproject.toml goes to bin folder
+        self._copy_project_files(
+            project_path, sink, config.get('icon'),
+            extra_targets={'pyproject.toml': 'bin/pyproject.toml'}
+        )
+
+        # Handle icon - always create 256x256 icon.ico in bin folder
+        sink.add_bytes("bin/icon.ico", self._process_icon(project_path, config))
+        
+        # Create scripts
+        self.script_generator.create_run_script(sink, config['entry_point'], config['name'])
+        self.script_generator.create_setup_script(sink, config['name'])
+    
+    def _process_icon(self, project_path, config):
+        """Process icon - either from config or generate default, always 256x256 ICO bytes"""
         if "icon" in config and config["icon"]:
             # User specified an icon
             icon_source = project_path / config["icon"]
@@ -293,48 +594,49 @@ class ProjectBundler:
             if source_ext == '.ico':
                 # Already ICO format, resize to 256x256
                 self.printer.step(f"Resizing ICO file {icon_source.name} to 256x256...")
-                self._resize_image_to_icon(icon_source, icon_dest)
+                icon_data = self._resize_image_to_icon(icon_source)
                 self.printer.success(f"Icon resized and saved as 256x256 icon.ico")
+                return icon_data
                 
             elif source_ext in self.SUPPORTED_IMAGE_FORMATS:
                 # Convert to 256x256 ICO format
                 try:
                     self.printer.step(f"Converting {icon_source.name} to 256x256 ICO format...")
-                    self._resize_image_to_icon(icon_source, icon_dest)
+                    icon_data = self._resize_image_to_icon(icon_source)
                     self.printer.success(f"Icon converted and saved as 256x256 icon.ico")
+                    return icon_data
                     
                 except Exception as e:
                     self.printer.warning(f"Failed to convert icon: {str(e)}")
                     # Generate default icon as fallback
                     self.printer.step("Generating default 256x256 icon...")
-                    self._generate_default_icon_256x256(icon_dest)
+                    icon_data = self._generate_default_icon_256x256()
                     self.printer.info("Default 256x256 icon generated")
+                    return icon_data
             else:
                 # This shouldn't happen due to early validation, but keep as safety
                 self.printer.warning(f"Unsupported icon format '{source_ext}'")
                 self.printer.step("Generating default 256x256 icon...")
-                self._generate_default_icon_256x256(icon_dest)
+                icon_data = self._generate_default_icon_256x256()
                 self.printer.info("Default 256x256 icon generated")
+                return icon_data
         else:
             # No icon specified, generate default 256x256
             self.printer.step("No icon specified, generating default 256x256 icon...")
-            self._generate_default_icon_256x256(icon_dest)
+            icon_data = self._generate_default_icon_256x256()
             self.printer.success("Default 256x256 icon generated")
+            return icon_data
     
-    def _create_bundle_directory(self, output_path, bundle_name):
-        """Create bundle directory, handling existing directories"""
+    def _create_bundle_directory(self, output_path, bundle_name, force=False):
+        """Create bundle directory, replacing an existing one only when forced"""
         bundle_dir = Path(output_path) / bundle_name
         
         if bundle_dir.exists():
-            print(f"Bundle directory already exists: {bundle_dir}")
-            response = input("Overwrite existing bundle? [y/N]: ").strip().lower()
-            
-            if response not in ('y', 'yes'):
-                print("Bundle creation cancelled")
-                return None
+            if not force:
+                raise FileExistsError(f"Bundle directory already exists: {bundle_dir}. Use --force to overwrite it")
             
             try:
-                shutil.rmtree(bundle_dir)
+                _fast_rmtree(bundle_dir)
             except PermissionError as e:
                 raise PermissionError(f"Cannot remove existing bundle directory. Files may be in use: {str(e)}")
         
@@ -344,10 +646,10 @@ class ProjectBundler:
         except PermissionError as e:
             raise PermissionError(f"Cannot create bundle directory. Check permissions: {str(e)}")
     
-    def _copy_project_files(self, source_path, target_path, icon_path=None):
-        """Copy project files to target directory, excluding certain patterns and icon file"""
+    def _copy_project_files(self, source_path, sink, icon_path=None, extra_targets=None):
+        """Copy project files into the bundle sink, excluding certain patterns and icon file"""
         exclude_items = set(self.EXCLUDE_PATTERNS)
-        exclude_items.add('pyproject.toml')
+        extra_targets = extra_targets or {}
         
         # Add icon file to exclude list if it exists to prevent duplication
         if icon_path:
@@ -356,75 +658,39 @@ class ProjectBundler:
             exclude_items.add(Path(icon_path).name)
         
         try:
-            for item in source_path.iterdir():
+            # scandir reports each entry's type from the listing, so no extra stat per item
+            with os.scandir(source_path) as entries:
+                items = list(entries)
+            
+            for item in items:
                 if item.name in exclude_items:
                     continue
                 
-                # Check if this item matches the icon path (for relative paths)
-                if icon_path and str(item.relative_to(source_path)) == icon_path:
+                # Top-level files redirected elsewhere in the bundle, e.g. pyproject.toml
+                if item.name in extra_targets:
+                    sink.add_file(item.path, extra_targets[item.name])
                     continue
                 
-                dest = target_path / item.name
                 if item.is_dir():
-                    shutil.copytree(item, dest, ignore=shutil.ignore_patterns('*.pyc', '__pycache__'))
+                    sink.add_tree(item.path, item.name, ignore=shutil.ignore_patterns('*.pyc', '__pycache__'))
                 else:
-                    shutil.copy2(item, dest)
+                    sink.add_file(item.path, item.name)
                     
         except Exception as e:
             raise Exception(f"Failed to copy project files: {str(e)}")
     
-    def _create_zip_archive(self, bundle_path, bundle_name):
-        """Create ZIP archive from bundle folder"""
-        if bundle_name is None:
-            archive_name = f"{bundle_path.name}.zip"
-        else:
-            archive_name = f"{bundle_name}.zip"
-        
-        archive_path = bundle_path.parent / archive_name
-        
-        if archive_path.exists():
-            raise ValueError(f"ZIP file already exists: {archive_path}")
-        
-        try:
-            compression_method, compress_level = self._get_zip_compression()
-            
-            with zipfile.ZipFile(archive_path, 'w', compression_method, compresslevel=compress_level) as zipf:
-                for file_path in bundle_path.rglob('*'):
-                    if file_path.is_file():
-                        arcname = file_path.relative_to(bundle_path.parent)
-                        zipf.write(file_path, arcname)
-            
-            # Remove bundle directory after successful archive creation
-            shutil.rmtree(bundle_path)
-            
-            # Print completion info
-            archive_size = archive_path.stat().st_size
-            self.printer.print_completion_info(
-                archive_path, "zip", archive_size, self.compression_level
-            )
-            
-            return archive_path
-            
-        except Exception as e:
-            if archive_path.exists():
-                archive_path.unlink()
-            raise Exception(f"ZIP creation failed: {str(e)}")
-    
     def _get_zip_compression(self):
         """Convert compression level to zipfile settings"""
         if self.compression_level == 0:
             return zipfile.ZIP_STORED, None
-        elif self.compression_level <= 3:
-            return zipfile.ZIP_DEFLATED, self.compression_level + 3
-        elif self.compression_level <= 6:
-            return zipfile.ZIP_DEFLATED, 6
-        else:
-            return zipfile.ZIP_DEFLATED, 9
+        # Levels map 1:1 onto zlib, so 1 really is the fastest deflate
+        return zipfile.ZIP_DEFLATED, self.compression_level
+    
+    def _get_zstd_level(self):
+        """Map compression level 0-9 to zstd levels 3-12"""
+        return self.compression_level + 3
     
     def _cleanup_bundle(self, bundle_dir):
         """Clean up partial bundle on error"""
-        if bundle_dir and Path(bundle_dir).exists():
-            try:
-                shutil.rmtree(bundle_dir)
-            except Exception:
-                pass
\ No newline at end of file
+        if bundle_dir:
+            _fast_rmtree(bundle_dir, ignore_errors=True)
\ No newline at end of file
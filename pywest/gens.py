@@ -1,19 +1,9 @@
-from pathlib import Path
-from .utils import StylePrinter
+from .utils import PRINTER
+from .sinks import as_sink
 
 
-class ScriptGenerator:
-    """Generate run and setup scripts for bundled projects"""
-    
-    def __init__(self):
-        self.printer = StylePrinter()
-    
-    def create_run_script(self, bundle_dir, entry_point, project_name):
-        """Create run.bat script for the bundle"""
-        module_name, func_name = entry_point.split(':')
-        run_script_path = Path(bundle_dir) / "run.bat"
-        
-        run_script_content = f"""
+# Script bodies are module constants; run.bat only fills in the entry point
+RUN_SCRIPT_TEMPLATE = """
 @echo off
 cd /d "%~dp0"
 set PYTHONPATH=%~dp0
@@ -23,15 +13,8 @@ bin\\python.exe -c "import sys; sys.path.insert(0, '.'); from {module_name} impo
 
 pause
 """
-     
-        with open(run_script_path, 'w', encoding='utf-8') as f:
-            f.write(run_script_content)
-    
-    def create_setup_script(self, bundle_dir, project_name):
-        """Create setup.bat script with admin elevation"""
-        setup_script_path = Path(bundle_dir) / "setup.bat"
-        
-        setup_script_content = """
+
+SETUP_SCRIPT = """
 @echo off
 :: Check if we are running as admin, if not, relaunch with elevation
 >nul 2>&1 "%SYSTEMROOT%\\system32\\cacls.exe" "%SYSTEMROOT%\\system32\\config\\system"
@@ -45,6 +28,27 @@ cd /d "%~dp0"
 :: Run bundled python with relative path to pywest.toml
 start "" bin\\pythonw.exe -c "__import__('pyweste').init_installer()"
 """
+
+
+class ScriptGenerator:
+    """Generate run and setup scripts for bundled projects"""
+    
+    def __init__(self):
+        self.printer = PRINTER
+    
+    def _write_script(self, target, name, content):
+        """Write a batch script with Windows line endings to a folder or sink"""
+        as_sink(target).add_bytes(name, content.replace('\n', '\r\n').encode('utf-8'))
+    
+    def create_run_script(self, target, entry_point, project_name):
+        """Create run.bat script for the bundle"""
+        module_name, func_name = entry_point.split(':')
+        
+        run_script_content = RUN_SCRIPT_TEMPLATE.format(module_name=module_name, func_name=func_name)
+        
+        self._write_script(target, "run.bat", run_script_content)
+    
+    def create_setup_script(self, target, project_name):
+        """Create setup.bat script with admin elevation"""
         
-        with open(setup_script_path, 'w', encoding='utf-8') as f:
-            f.write(setup_script_content)
\ No newline at end of file
+        self._write_script(target, "setup.bat", SETUP_SCRIPT)
\ No newline at end of file
@@ -0,0 +1,384 @@
+import io
+import os
+import time
+import zlib
+import shutil
+import queue
+import tarfile
+import zipfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from .utils import PRINTER
+
+try:
+    # Optional ISA-L bindings deflate several times faster than zlib at their fast levels
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
+
+try:
+    # libdeflate compresses whole buffers faster than zlib at the same level and ratio
+    import deflate as libdeflate
+except ImportError:
+    libdeflate = None
+
+try:
+    # zlib-ng is a drop-in zlib with SIMD match finding, used for every other level when installed
+    from zlib_ng import zlib_ng as deflate_zlib
+except ImportError:
+    deflate_zlib = zlib
+
+
+def _workers_from_env(name, default):
+    """Read a worker count override from the environment; unset or 0 keeps the default"""
+    value = os.environ.get(name, '').strip()
+    try:
+        workers = int(value or 0)
+    except ValueError:
+        workers = -1
+    if workers < 0:
+        PRINTER.warning(f"Ignoring {name}={value!r}: expected a positive integer")
+    return workers if workers > 0 else default
+
+
+# zlib releases the GIL while deflating, so threads compress entries in parallel
+COMPRESSION_WORKERS = _workers_from_env('PYWEST_COMPRESSION_WORKERS', min(os.cpu_count() or 1, 4))
+# File copies are syscall-bound and release the GIL, so oversubscribe the cores
+COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+STREAM_CHUNK_SIZE = 1024 * 1024
+LARGE_FILE_SIZE = 8 * 1024 * 1024
+# Small files are compressed in batches so per-task overhead does not dominate
+SMALL_FILE_SIZE = 64 * 1024
+BATCH_SIZE = 512 * 1024
+
+# Already-compressed formats gain nothing from Deflate, so they are stored as-is
+STORED_EXTENSIONS = frozenset({
+    '.zip', '.whl', '.7z', '.gz', '.tgz', '.bz2', '.xz', '.zst',
+    '.png', '.jpg', '.jpeg', '.gif', '.webp', '.mp3', '.mp4', '.ogg', '.webm', '.woff2',
+})
+COMPRESSED_MAGIC = (b'PK\x03\x04', b'\x1f\x8b', b'7z\xbc\xaf', b'\xfd7zXZ\x00', b'\x28\xb5\x2f\xfd')
+# Bytes of a file's head to read so that every signature above can match
+MAGIC_SIZE = max(len(magic) for magic in COMPRESSED_MAGIC)
+
+# ZipSink writes pre-deflated entries through ZipFile internals that are not public API.
+# Checked against CPython 3.11, 3.12 and 3.13; the test suite fails if any of them goes away
+_ZIPFILE_INTERNALS = ('_lock', '_seekable', '_writecheck', '_didModify', 'start_dir', 'fp', 'filelist', 'NameToInfo')
+# The per-entry level ZipFile.open(zinfo, 'w') reads was renamed from _compresslevel in 3.13
+_ZIPINFO_LEVEL = 'compress_level' if 'compress_level' in zipfile.ZipInfo.__slots__ else '_compresslevel'
+
+
+def _is_precompressed(name, head=b''):
+    """Check whether a file is already compressed, by extension or magic bytes"""
+    return os.path.splitext(name)[1].lower() in STORED_EXTENSIONS or head.startswith(COMPRESSED_MAGIC)
+
+
+def _walk_files(source, ignore=None):
+    """Yield (DirEntry, relative path) for every file below source in sorted order"""
+    # DirEntry caches file type and stat from the listing, avoiding a stat per path
+    stack = [(os.fspath(source), '')]
+    while stack:
+        directory, prefix = stack.pop()
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+
+        if ignore is not None:
+            ignored = ignore(directory, [entry.name for entry in entries])
+            entries = [entry for entry in entries if entry.name not in ignored]
+
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append((entry.path, f"{prefix}{entry.name}/"))
+            elif entry.is_file():
+                yield entry, f"{prefix}{entry.name}"
+        stack.extend(reversed(subdirs))
+
+
+def _zipinfo_from_stat(arcname, st):
+    """Build a ZipInfo from an existing stat result, like ZipInfo.from_file without the stat"""
+    date_time = time.localtime(st.st_mtime)[:6]
+    # Clamp out-of-range mtimes like ZipFile(strict_timestamps=False) instead of failing
+    if date_time[0] < 1980:
+        date_time = (1980, 1, 1, 0, 0, 0)
+    elif date_time[0] > 2107:
+        date_time = (2107, 12, 31, 23, 59, 59)
+    zinfo = zipfile.ZipInfo(arcname, date_time)
+    zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+    zinfo.file_size = st.st_size
+    return zinfo
+
+
+def _compress_entry(file_path, arcname, st, level):
+    """Read and deflate a single file into a ready-to-write (ZipInfo, bytes) pair"""
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    return _deflate_entry(_zipinfo_from_stat(arcname, st), data, level)
+
+
+def _compress_batch(batch, level):
+    """Compress several small files in one task, keeping their order"""
+    return [_compress_entry(file_path, arcname, st, level) for file_path, arcname, st in batch]
+
+
+# ISA-L's CRC-32 uses the same IEEE polynomial as zlib, folded with PCLMULQDQ
+_crc32 = (isal_zlib or libdeflate or deflate_zlib).crc32
+
+
+def _raw_deflate(data, level):
+    """Raw-deflate a whole buffer, preferring ISA-L, libdeflate and zlib-ng over zlib when installed"""
+    if isal_zlib is not None and 1 <= level <= isal_zlib.ISAL_BEST_COMPRESSION:
+        compressor = isal_zlib.compressobj(level, isal_zlib.DEFLATED, -15)
+    elif libdeflate is not None and 1 <= level <= 9:
+        # libdeflate's levels 1-9 track zlib's; its slower 10-12 are left unused
+        return libdeflate.deflate_compress(data, level)
+    else:
+        compressor = deflate_zlib.compressobj(level, deflate_zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush()
+
+
+def _deflate_entry(zinfo, data, level):
+    """Deflate file bytes into a ready-to-write (ZipInfo, bytes) pair"""
+    zinfo.compress_type = zipfile.ZIP_STORED
+    payload = data
+    if not _is_precompressed(zinfo.filename, data[:MAGIC_SIZE]):
+        compressed = _raw_deflate(data, level)
+        # Keep the raw bytes when Deflate does not actually shrink the entry
+        if len(compressed) < len(data):
+            zinfo.compress_type = zipfile.ZIP_DEFLATED
+            payload = compressed
+
+    zinfo.file_size = len(data)
+    zinfo.compress_size = len(payload)
+    zinfo.CRC = _crc32(data)
+    return zinfo, payload
+
+
+def _read_entries(entries, read_queue, stop):
+    """Producer for the read/compress pipeline; large files are left for streaming"""
+    try:
+        for entry, relative in entries:
+            if stop.is_set():
+                return
+            st = entry.stat()
+            data = None
+            if st.st_size <= LARGE_FILE_SIZE:
+                with open(entry.path, 'rb') as f:
+                    data = f.read()
+            read_queue.put((entry, relative, st, data))
+    except Exception as e:
+        read_queue.put(e)
+    read_queue.put(None)
+
+
+class FolderSink:
+    """Write bundle files into a folder on disk"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def _target(self, arcname):
+        path = self.root / arcname
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def add_bytes(self, arcname, data):
+        """Write raw bytes to arcname inside the bundle"""
+        self._target(arcname).write_bytes(data)
+
+    def add_file(self, source, arcname):
+        """Copy a single file into the bundle"""
+        shutil.copy2(source, self._target(arcname))
+
+    def add_tree(self, source, arcname, ignore=None, copy_function=None):
+        """Copy a directory tree into the bundle, copying files on a thread pool"""
+        # copy2 uses CopyFile2 on Windows (3.12+), copying data and metadata in one call
+        copy_function = copy_function or shutil.copy2
+        source = os.fspath(source)
+        target_root = os.path.join(self.root, arcname)
+
+        # Single walk: directories are created here, file copies are collected
+        copies = []
+        for root, dirs, files in os.walk(source):
+            if ignore is not None:
+                ignored = ignore(root, dirs + files)
+                dirs[:] = [d for d in dirs if d not in ignored]
+                files = [f for f in files if f not in ignored]
+
+            target_dir = os.path.normpath(os.path.join(target_root, os.path.relpath(root, source)))
+            os.makedirs(target_dir, exist_ok=True)
+            copies.extend((os.path.join(root, name), os.path.join(target_dir, name)) for name in files)
+
+        with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+            list(executor.map(lambda pair: copy_function(*pair), copies))
+
+
+class ZipSink:
+    """Write bundle files straight into an open ZIP archive under a root folder"""
+
+    def __init__(self, zipf, root, workers=None):
+        self.zipf = zipf
+        self.root = root
+        self.workers = workers or COMPRESSION_WORKERS
+
+    def _arcname(self, arcname):
+        return f"{self.root}/{os.fspath(arcname).replace(os.sep, '/')}"
+
+    def add_bytes(self, arcname, data):
+        """Write raw bytes to arcname inside the archive"""
+        self.zipf.writestr(self._arcname(arcname), data)
+
+    def add_file(self, source, arcname):
+        """Stream a single file into the archive in fixed-size chunks"""
+        self._stream_file(source, self._arcname(arcname), os.stat(source))
+
+    def _stream_file(self, source, full_arcname, st):
+        """Stream source into the archive under an already-resolved arcname"""
+        zinfo = _zipinfo_from_stat(full_arcname, st)
+        zinfo.compress_type = self.zipf.compression
+        setattr(zinfo, _ZIPINFO_LEVEL, self.zipf.compresslevel)
+
+        with open(source, 'rb', buffering=STREAM_CHUNK_SIZE) as src:
+            if _is_precompressed(zinfo.filename, src.peek(MAGIC_SIZE)[:MAGIC_SIZE]):
+                zinfo.compress_type = zipfile.ZIP_STORED
+            # The size is known from stat, so zipfile only adds ZIP64 extras when actually needed
+            with self.zipf.open(zinfo, 'w') as dst:
+                shutil.copyfileobj(src, dst, STREAM_CHUNK_SIZE)
+
+    def add_tree(self, source, arcname, ignore=None):
+        """Compress a directory tree into the archive"""
+        prefix = self._arcname(arcname)
+        entries = list(_walk_files(source, ignore))
+
+        if self.zipf.compression != zipfile.ZIP_DEFLATED:
+            for entry, relative in entries:
+                self._stream_file(entry.path, f"{prefix}/{relative}", entry.stat())
+            return
+
+        level = self.zipf.compresslevel
+        if level is None:
+            level = zlib.Z_DEFAULT_COMPRESSION
+
+        if self.workers < 2:
+            self._add_entries_pipelined(prefix, entries, level)
+            return
+
+        # Compress batches on the pool, write serially in walk order; the window bounds memory
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            pending = deque()
+            batch, batch_bytes = [], 0
+
+            def submit_batch():
+                nonlocal batch, batch_bytes
+                if batch:
+                    pending.append(executor.submit(_compress_batch, batch, level))
+                    batch, batch_bytes = [], 0
+
+            def drain(limit=0):
+                while len(pending) > limit:
+                    for compressed in pending.popleft().result():
+                        self._write_compressed(*compressed)
+
+            for entry, relative in entries:
+                st = entry.stat()
+                if st.st_size > LARGE_FILE_SIZE:
+                    # Large files are streamed here instead of being read whole by a worker
+                    submit_batch()
+                    drain()
+                    self._stream_file(entry.path, f"{prefix}/{relative}", st)
+                    continue
+
+                batch.append((entry.path, f"{prefix}/{relative}", st))
+                batch_bytes += st.st_size
+                if st.st_size > SMALL_FILE_SIZE or batch_bytes >= BATCH_SIZE:
+                    submit_batch()
+                    drain(self.workers * 4)
+            submit_batch()
+            drain()
+
+    def _add_entries_pipelined(self, prefix, entries, level):
+        """Overlap file reads on a reader thread with compression on this thread"""
+        # Bounded queue keeps at most a handful of files in memory
+        read_queue = queue.Queue(maxsize=8)
+        stop = threading.Event()
+        reader = threading.Thread(target=_read_entries, args=(entries, read_queue, stop), daemon=True)
+        reader.start()
+
+        try:
+            while (item := read_queue.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                entry, relative, st, data = item
+                if data is None:
+                    self._stream_file(entry.path, f"{prefix}/{relative}", st)
+                else:
+                    zinfo = _zipinfo_from_stat(f"{prefix}/{relative}", st)
+                    self._write_compressed(*_deflate_entry(zinfo, data, level))
+        finally:
+            # Unblock a reader stuck on a full queue so it sees the stop flag and exits
+            stop.set()
+            while True:
+                try:
+                    read_queue.get_nowait()
+                except queue.Empty:
+                    break
+            reader.join()
+
+    def _write_compressed(self, zinfo, data):
+        """Append an already-compressed or stored entry without recompressing it"""
+        # Mirrors ZipFile.writestr's locked append; see _ZIPFILE_INTERNALS for the fields involved
+        zipf = self.zipf
+        with zipf._lock:
+            if zipf._seekable:
+                zipf.fp.seek(zipf.start_dir)
+            zinfo.header_offset = zipf.fp.tell()
+            zipf._writecheck(zinfo)
+            zipf._didModify = True
+            zipf.fp.write(zinfo.FileHeader())
+            zipf.fp.write(data)
+            zipf.filelist.append(zinfo)
+            zipf.NameToInfo[zinfo.filename] = zinfo
+            zipf.start_dir = zipf.fp.tell()
+
+
+class TarSink:
+    """Write bundle files into an open streaming tar archive under a root folder"""
+
+    def __init__(self, tar, root):
+        self.tar = tar
+        self.root = root
+
+    def _arcname(self, arcname):
+        return f"{self.root}/{os.fspath(arcname).replace(os.sep, '/')}"
+
+    def add_bytes(self, arcname, data):
+        """Write raw bytes to arcname inside the archive"""
+        tarinfo = tarfile.TarInfo(self._arcname(arcname))
+        tarinfo.size = len(data)
+        tarinfo.mtime = int(time.time())
+        tarinfo.mode = 0o644
+        self.tar.addfile(tarinfo, io.BytesIO(data))
+
+    def add_file(self, source, arcname):
+        """Add a single file to the archive"""
+        self._add_path(source, self._arcname(arcname))
+
+    def _add_path(self, source, full_arcname):
+        """Add source under an already-resolved arcname, reusing the open handle's fstat"""
+        with open(source, 'rb', buffering=STREAM_CHUNK_SIZE) as src:
+            tarinfo = self.tar.gettarinfo(arcname=full_arcname, fileobj=src)
+            self.tar.addfile(tarinfo, src)
+
+    def add_tree(self, source, arcname, ignore=None):
+        """Add a directory tree to the archive in walk order"""
+        prefix = self._arcname(arcname)
+        for entry, relative in _walk_files(source, ignore):
+            self._add_path(entry.path, f"{prefix}/{relative}")
+
+
+def as_sink(target):
+    """Wrap a folder path in a FolderSink, pass existing sinks through"""
+    if isinstance(target, (FolderSink, ZipSink, TarSink)):
+        return target
+    return FolderSink(target)
@@ -1,11 +1,12 @@
+import io
 import os
-import sys
+import time
 import shutil
-import zipfile
-import urllib.request
-import subprocess
 from pathlib import Path
 
+# Network, archive and process modules are imported where used: the CLI loads this
+# module just for the printer, and urllib.request alone pulls in http.client and email
+
 
 class StylePrinter:
     """Stylized output printer with color support"""
@@ -64,82 +65,262 @@ class StylePrinter:
 
     @staticmethod
     def print_banner(title="PyWest Bundler"):
-        print(f"\n{StylePrinter.Colors.BOLD}{StylePrinter.Colors.BRIGHT_CYAN}🚀 {title}{StylePrinter.Colors.RESET}")
-        print(f"{StylePrinter.Colors.DIM}{'─' * 50}{StylePrinter.Colors.RESET}")
+        print(f"\n{StylePrinter.Colors.BOLD}{StylePrinter.Colors.BRIGHT_CYAN}🚀 {title}{StylePrinter.Colors.RESET}\n"
+              f"{StylePrinter.Colors.DIM}{'─' * 50}{StylePrinter.Colors.RESET}")
 
     @staticmethod
     def print_project_info(project_name, output_path, dependency_count=0):
-        print(f"Project: {project_name}")
-        print(f"Output: {output_path}")
+        lines = [f"Project: {project_name}", f"Output: {output_path}"]
         if dependency_count > 0:
-            print(f"Dependencies: {dependency_count}")
-        print("")
+            lines.append(f"Dependencies: {dependency_count}")
+        print("\n".join(lines), end="\n\n")
 
     @staticmethod
     def print_completion_info(bundle_path, bundle_type="folder", file_size=None, compression_level=None):
-        print(f"{StylePrinter.Colors.BRIGHT_GREEN}✅ Bundle created successfully!{StylePrinter.Colors.RESET}")
-        print(f"   Location: {bundle_path}")
+        # Joined into one write so parallel bundle workers cannot interleave the block
+        lines = [
+            f"{StylePrinter.Colors.BRIGHT_GREEN}✅ Bundle created successfully!{StylePrinter.Colors.RESET}",
+            f"   Location: {bundle_path}",
+        ]
         
         if bundle_type == "folder":
-            print(f"   Run with: {bundle_path / 'run.bat'}")
-            print(f"   Install with: {bundle_path / 'setup.bat'}")
+            lines.append(f"   Run with: {bundle_path / 'run.bat'}")
+            lines.append(f"   Install with: {bundle_path / 'setup.bat'}")
         else:
             if file_size:
-                print(f"   Size: {file_size / (1024*1024):.1f} MB")
+                lines.append(f"   Size: {file_size / (1024*1024):.1f} MB")
             if compression_level is not None:
-                print(f"   Compression level: {compression_level}")
+                lines.append(f"   Compression level: {compression_level}")
+        print("\n".join(lines))
+
+
+# Shared printer instance; StylePrinter is stateless apart from class-level progress tracking
+PRINTER = StylePrinter()
 
 
 class PythonManager:
     """Handle Python environment setup and management"""
     
-    SUPPORTED_VERSIONS = ['3.12.10', '3.11.9']
+    # A tuple, not a set: the CLI lists these in order as --python choices
+    SUPPORTED_VERSIONS = ('3.12.10', '3.11.9')
     DEFAULT_VERSION = '3.12.10'
+    EMBED_FILENAME = "python-{version}-embed-amd64.zip"
     BASE_URL = "https://www.python.org/ftp/python"
+    GET_PIP_URL = "https://bootstrap.pypa.io/get-pip.py"
+    EXTRACT_WORKERS = os.cpu_count() or 1
+    DOWNLOAD_SEGMENTS = 4
+    MIN_SEGMENT_SIZE = 1024 * 1024
+    DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+    WHEEL_DOWNLOAD_WORKERS = 8
+    DOWNLOAD_TIMEOUT = 30
+    DOWNLOAD_RETRIES = 3
+    RETRY_BACKOFF = 0.3
+    # Archives are fetched byte-for-byte; identity encoding keeps Content-Length and ranges exact
+    REQUEST_HEADERS = {'Accept-Encoding': 'identity', 'User-Agent': 'pywest'}
+    # Run by the bundled interpreter so caches carry its magic number and cpython-3xx tag;
+    # hash-checked caches stay valid after archiving truncates mtimes
+    COMPILE_SCRIPT = (
+        "import os, sys, py_compile, importlib.util\n"
+        "source_root, output_root = sys.argv[1:3]\n"
+        "for relative in sys.stdin.buffer.read().decode('utf-8').splitlines():\n"
+        "    py_compile.compile(\n"
+        "        os.path.join(source_root, relative),\n"
+        "        importlib.util.cache_from_source(os.path.join(output_root, relative)),\n"
+        "        dfile=relative, quiet=2,\n"
+        "        invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH)\n"
+    )
     
     def __init__(self):
         self.cache_dir = Path.home() / ".pywest"
         self.cache_dir.mkdir(exist_ok=True)
-        self.printer = StylePrinter()
+        self.wheel_dir = self.cache_dir / "wheels"
+        self.pip_cache_dir = self.cache_dir / "pip-cache"
+        # PYWEST_NO_CACHE=1 fetches everything afresh; downloads still refresh the cache
+        self.use_cache = not os.environ.get('PYWEST_NO_CACHE')
+        self.printer = PRINTER
     
     def get_cached_path(self, python_version):
-        filename = f"python-{python_version}-embed-amd64.zip"
-        return self.cache_dir / filename
+        return self.cache_dir / self.EMBED_FILENAME.format(version=python_version)
     
     def is_cached(self, python_version):
-        return self.get_cached_path(python_version).exists()
+        return self.use_cache and self.get_cached_path(python_version).exists()
     
-    def download_python(self, python_version):
-        """Download Python embeddable if not cached"""
+    def _fetch_python(self, python_version):
+        """Return (archive bytes, ETag) of a fresh download, or None when the cache is current"""
+        import urllib.error
+        
         cached_path = self.get_cached_path(python_version)
+        etag_path = cached_path.with_suffix('.etag')
+        embed_url = f"{self.BASE_URL}/{python_version}/{cached_path.name}"
+        headers = {}
         
         if self.is_cached(python_version):
-            print(f"Using cached Python embeddable {python_version}...")
-            return cached_path
-        
-        print(f"Downloading Python embeddable {python_version}...")
-        embed_url = f"{self.BASE_URL}/{python_version}/python-{python_version}-embed-amd64.zip"
-        
-        old_stderr = sys.stderr
-        sys.stderr = open(os.devnull, 'w')
+            if not etag_path.exists():
+                # Cached before ETags were recorded; release files are immutable
+                print(f"Using cached Python embeddable {python_version}...")
+                return None
+            headers['If-None-Match'] = etag_path.read_text().strip()
         
         try:
-            urllib.request.urlretrieve(embed_url, cached_path)
+            # The first segment doubles as the revalidation request, so no separate HEAD round trip
+            headers['Range'] = f"bytes=0-{self.MIN_SEGMENT_SIZE - 1}"
+            with self._open_url(embed_url, headers) as response:
+                print(f"Downloading Python embeddable {python_version}...")
+                etag = response.headers.get('ETag')
+                if response.status != 206:
+                    # Server ignored the range and sent the whole archive
+                    return self._read_complete(response), etag
+                try:
+                    return self._download_segmented(embed_url, response, etag), etag
+                except Exception:
+                    # A segment came back whole (If-Range mismatch, Range ignored) or failed midway
+                    pass
+            
+            # Fall back to a single plain GET before giving up
+            with self._open_url(embed_url) as response:
+                return self._read_complete(response), response.headers.get('ETag')
         except Exception as e:
-            raise Exception(f"Failed to download Python {python_version}: {str(e)}")
+            if not self.is_cached(python_version):
+                raise Exception(f"Failed to download Python {python_version}: {str(e)}")
+            
+            if isinstance(e, urllib.error.HTTPError) and e.code == 304:
+                print(f"Using cached Python embeddable {python_version}...")
+            else:
+                # Offline or server unreachable: fall back to the cached copy
+                print(f"Using cached Python embeddable {python_version} (could not revalidate)...")
+            return None
+    
+    def _store_python(self, python_version, data, etag):
+        """Write a downloaded archive and its ETag into the cache atomically"""
+        cached_path = self.get_cached_path(python_version)
+        etag_path = cached_path.with_suffix('.etag')
+        self._write_atomic(cached_path, data)
+        
+        if etag:
+            self._write_atomic(etag_path, etag.encode())
+        else:
+            etag_path.unlink(missing_ok=True)
+    
+    @classmethod
+    def _write_atomic(cls, target_path, data):
+        """Write data to a private temp file and swap it in, so readers never see a partial file"""
+        temp_path = cls._temp_path(target_path)
+        try:
+            temp_path.write_bytes(data)
+            os.replace(temp_path, target_path)
         finally:
-            sys.stderr.close()
-            sys.stderr = old_stderr
+            temp_path.unlink(missing_ok=True)
+    
+    def _download_segmented(self, url, first_response, etag):
+        """Fetch the rest of url as parallel byte ranges while the first segment is read"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        content_range = first_response.headers.get('Content-Range', '')
+        if not content_range.rpartition('/')[2].isdigit():
+            raise Exception(f"unexpected Content-Range: {content_range!r}")
+        size = int(content_range.rpartition('/')[2])
+        first_size = min(self.MIN_SEGMENT_SIZE, size)
         
-        return cached_path
+        remaining = size - first_size
+        segments = max(1, min(self.DOWNLOAD_SEGMENTS, remaining // self.MIN_SEGMENT_SIZE))
+        step = -(-remaining // segments) if remaining else 1
+        ranges = [(lo, min(lo + step, size) - 1) for lo in range(first_size, size, step)]
+        buffer = bytearray(size)
+        # If-Range makes the server send a full 200 instead of mixing bytes from a changed file
+        range_headers = {'If-Range': etag} if etag else {}
+        
+        with ThreadPoolExecutor(max_workers=max(1, len(ranges))) as executor:
+            pending = [
+                executor.submit(self._fetch_range, url, buffer, lo, hi, range_headers)
+                for lo, hi in ranges
+            ]
+            self._read_into(first_response, memoryview(buffer)[:first_size])
+            for future in pending:
+                future.result()
+        return bytes(buffer)
+    
+    @staticmethod
+    def _read_complete(response):
+        """Read a whole response body, rejecting one shorter than its Content-Length"""
+        data = response.read()
+        expected_size = response.headers.get('Content-Length')
+        if expected_size is not None and len(data) != int(expected_size):
+            raise Exception(f"incomplete download ({len(data)} of {expected_size} bytes)")
+        return data
     
-    def extract_python(self, cached_path, target_dir):
-        """Extract Python embeddable to target directory"""
+    @classmethod
+    def _fetch_range(cls, url, buffer, lo, hi, headers=None):
+        """Download bytes lo..hi of url into the same slice of buffer"""
+        with cls._open_url(url, {**(headers or {}), 'Range': f'bytes={lo}-{hi}'}) as response:
+            if response.status != 206:
+                raise Exception(f"server ignored range request (HTTP {response.status})")
+            cls._read_into(response, memoryview(buffer)[lo:hi + 1])
+    
+    @staticmethod
+    def _read_into(response, view):
+        """Fill view from response, rejecting short reads"""
+        filled = 0
+        while filled < len(view) and (count := response.readinto(view[filled:])):
+            filled += count
+        if filled != len(view):
+            raise Exception(f"incomplete segment ({filled} of {len(view)} bytes)")
+    
+    @classmethod
+    def _open_url(cls, url, headers=None, method=None):
+        """Open url with pywest's default request headers, retrying transient failures"""
+        import urllib.error
+        import urllib.request
+        
+        request = urllib.request.Request(url, headers={**cls.REQUEST_HEADERS, **(headers or {})}, method=method)
+        for attempt in range(cls.DOWNLOAD_RETRIES + 1):
+            try:
+                return urllib.request.urlopen(request, timeout=cls.DOWNLOAD_TIMEOUT)
+            except urllib.error.HTTPError as e:
+                # Only server-side and rate-limit errors are worth another try; 304 and 404 are answers
+                if attempt == cls.DOWNLOAD_RETRIES or (e.code < 500 and e.code != 429):
+                    raise
+            except (urllib.error.URLError, TimeoutError, ConnectionError):
+                if attempt == cls.DOWNLOAD_RETRIES:
+                    raise
+            time.sleep(cls.RETRY_BACKOFF * 2 ** attempt)
+    
+    @classmethod
+    def _save_download(cls, response, target_path):
+        """Write a response body to target_path atomically, rejecting truncated downloads"""
+        temp_path = cls._temp_path(target_path)
+        try:
+            with open(temp_path, 'wb') as f:
+                shutil.copyfileobj(response, f, cls.DOWNLOAD_BUFFER_SIZE)
+            
+            expected_size = response.headers.get('Content-Length')
+            if expected_size is not None and temp_path.stat().st_size != int(expected_size):
+                raise Exception(f"incomplete download ({temp_path.stat().st_size} of {expected_size} bytes)")
+            
+            os.replace(temp_path, target_path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+    
+    def extract_python(self, source, target_dir):
+        """Extract Python embeddable to target directory from a cached path or archive bytes"""
+        from concurrent.futures import ThreadPoolExecutor
+        
         target_dir.mkdir(parents=True, exist_ok=True)
         
         try:
-            with zipfile.ZipFile(cached_path, 'r') as zip_ref:
-                zip_ref.extractall(target_dir)
+            with self._open_archive(source) as zip_ref:
+                members = [member for member in zip_ref.infolist() if not member.is_dir()]
+            
+            # Create parent directories serially; concurrent makedirs inside extract() can race
+            for parent in {os.path.dirname(member.filename) for member in members}:
+                if parent and '..' not in parent.split('/') and not os.path.isabs(parent):
+                    (target_dir / parent).mkdir(parents=True, exist_ok=True)
+            
+            # Inflate releases the GIL, so members extract in parallel, balanced by size
+            buckets = self._balance_members(members, self.EXTRACT_WORKERS)
+            with ThreadPoolExecutor(max_workers=len(buckets)) as executor:
+                list(executor.map(
+                    lambda bucket: self._extract_members(source, bucket, target_dir), buckets
+                ))
             
             python_exe = target_dir / "python.exe"
             pythonw_exe = target_dir / "pythonw.exe"
@@ -152,21 +333,108 @@ class PythonManager:
         
         return target_dir
     
-    def setup_environment(self, python_version, target_dir, dependencies=None):
-        """Download, extract and setup Python environment"""
-        cached_path = self.download_python(python_version)
-        self.extract_python(cached_path, target_dir)
+    @staticmethod
+    def _open_archive(source):
+        """Open a ZIP from a path, or from bytes through a private BytesIO view"""
+        import zipfile
+        
+        if isinstance(source, bytes):
+            # BytesIO shares an immutable bytes buffer, so each handle is a cheap view
+            return zipfile.ZipFile(io.BytesIO(source), 'r')
+        return zipfile.ZipFile(source, 'r')
+    
+    @staticmethod
+    def _balance_members(members, workers):
+        """Split members into at most workers groups of similar uncompressed size"""
+        # The embeddable has only a few dozen members, a handful of them multi-megabyte DLLs
+        # and the stdlib ZIP; placing the largest first keeps those on separate workers
+        buckets = [[] for _ in range(max(1, min(workers, len(members))))]
+        loads = [0] * len(buckets)
+        for member in sorted(members, key=lambda member: member.file_size, reverse=True):
+            lightest = loads.index(min(loads))
+            buckets[lightest].append(member)
+            loads[lightest] += member.file_size
+        return buckets
+    
+    @classmethod
+    def _extract_members(cls, source, members, target_dir):
+        """Extract a subset of members using a private ZipFile handle"""
+        with cls._open_archive(source) as zip_ref:
+            for member in members:
+                zip_ref.extract(member, target_dir)
+    
+    def setup_environment(self, python_version, target_dir, dependencies=None, link=False):
+        """Copy the prepared Python environment into target_dir and install dependencies"""
+        from .sinks import FolderSink
+        
+        if not self.use_cache:
+            self._build_environment(python_version, target_dir)
+            if dependencies:
+                self.install_dependencies(target_dir / "python.exe", dependencies)
+            return
         
-        python_exe = target_dir / "python.exe"
+        template_dir = self.prepare_template(python_version)
         
-        # Setup pip
-        self._setup_pip(python_exe, target_dir)
+        print("Copying Python environment...")
+        # Hard links are only safe for throwaway trees; user-facing bundles get real copies
+        copy_function = self._link_or_copy if link else None
+        FolderSink(target_dir.parent).add_tree(template_dir, target_dir.name, copy_function=copy_function)
         
         # Install dependencies
         if dependencies:
-            self._install_dependencies(python_exe, dependencies)
+            self.install_dependencies(target_dir / "python.exe", dependencies)
+    
+    def prepare_template(self, python_version):
+        """Return a cached bin directory with Python extracted and pip set up, building it once"""
+        import tempfile
+        
+        template_dir = self.cache_dir / f"bin-template-{python_version}"
+        if template_dir.exists():
+            return template_dir
+        
+        # Build beside the final location and rename, so a half-built template is never used
+        build_dir = Path(tempfile.mkdtemp(prefix=f"{template_dir.name}-", dir=self.cache_dir))
+        try:
+            self._build_environment(python_version, build_dir)
+            os.rename(build_dir, template_dir)
+        except OSError:
+            # Another process published the same template first
+            if not template_dir.exists():
+                raise
+        finally:
+            shutil.rmtree(build_dir, ignore_errors=True)
+        
+        return template_dir
+    
+    def _build_environment(self, python_version, target_dir):
+        """Extract the Python embeddable into target_dir and set up pip"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # get-pip.py downloads while the embeddable is fetched and extracted
+            get_pip = executor.submit(self.get_pip_script)
+            
+            download = self._fetch_python(python_version)
+            if download is None:
+                self.extract_python(self.get_cached_path(python_version), target_dir)
+            else:
+                # Extract straight from memory while the cache copy is written alongside
+                stored = executor.submit(self._store_python, python_version, *download)
+                self.extract_python(download[0], target_dir)
+                stored.result()
+            
+            # Setup pip
+            self._setup_pip(target_dir / "python.exe", target_dir, get_pip.result())
+    
+    @staticmethod
+    def _link_or_copy(source, target):
+        """Hard-link source to target, copying when links are unsupported or cross devices"""
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copy2(source, target)
     
-    def _setup_pip(self, python_exe, python_dir):
+    def _setup_pip(self, python_exe, python_dir, get_pip_path=None):
         """Setup pip in embeddable Python"""
         print("Setting up pip...")
         
@@ -174,41 +442,170 @@ class PythonManager:
         pth_files = list(python_dir.glob("*._pth"))
         if pth_files:
             pth_file = pth_files[0]
-            with open(pth_file, 'r') as f:
-                content = f.read()
-            content = content.replace("#import site", "import site")
-            with open(pth_file, 'w') as f:
-                f.write(content)
+            # Write beside the original and swap it in, so python.exe never sees a partial file
+            temp_file = pth_file.with_name(pth_file.name + ".tmp")
+            temp_file.write_bytes(pth_file.read_bytes().replace(b"#import site", b"import site"))
+            os.replace(temp_file, pth_file)
         
-        # Download and install pip
-        get_pip_path = python_dir / "get-pip.py"
-        get_pip_url = "https://bootstrap.pypa.io/get-pip.py"
-        
-        try:
-            urllib.request.urlretrieve(get_pip_url, get_pip_path)
-            self._run_silent([str(python_exe), str(get_pip_path), "--no-warn-script-location"])
-        finally:
-            if get_pip_path.exists():
-                get_pip_path.unlink()
+        # Install pip alone from the cached bootstrap script; sdists that need
+        # setuptools or wheel get them through pip's isolated build environments
+        get_pip_path = get_pip_path or self.get_pip_script()
+        if self._run_silent([
+            str(python_exe), str(get_pip_path), "--no-warn-script-location",
+            "--no-setuptools", "--no-wheel",
+            *self._pip_cache_args()
+        ]) != 0:
+            raise Exception("Failed to set up pip")
+    
+    def compile_sources(self, python_exe, source_root, relative_paths, output_root):
+        """Byte-compile sources with the bundled Python into __pycache__ folders under output_root"""
+        print("Compiling project sources...")
+        command = [str(python_exe), "-c", self.COMPILE_SCRIPT, str(source_root), str(output_root)]
+        return self._run_silent(command, "\n".join(relative_paths).encode('utf-8')) == 0
+    
+    def _pip_cache_args(self):
+        """pip arguments pointing its HTTP and build cache into pywest's cache"""
+        if not self.use_cache:
+            return ["--no-cache-dir"]
+        return ["--cache-dir", str(self.pip_cache_dir)]
     
-    def _install_dependencies(self, python_exe, dependencies):
-        """Install project dependencies"""
+    def get_pip_script(self):
+        """Return the cached get-pip.py, downloading it on first use"""
+        get_pip_path = self.cache_dir / "get-pip.py"
+        if not self.use_cache or not get_pip_path.exists():
+            with self._open_url(self.GET_PIP_URL) as response:
+                self._save_download(response, get_pip_path)
+        return get_pip_path
+    
+    def install_dependencies(self, python_exe, dependencies):
+        """Install project dependencies, reusing wheels cached by earlier bundles"""
         print("Installing project dependencies...")
+        pip_cmd = [str(python_exe), "-m", "pip"]
+        # The version check is a network round trip per pip call that only prints a notice
+        # --prefer-binary avoids building sdists when an older release ships a wheel
+        common_args = ["--quiet", "--disable-pip-version-check", "--prefer-binary",
+                      "--no-input", *self._pip_cache_args()]
+        find_links = ["--find-links", str(self.wheel_dir)]
+        install_cmd = pip_cmd + ["install", "--no-warn-script-location", *common_args, *find_links]
+        offline_cmd = install_cmd + ["--no-index"]
+        # pip wheel builds sdists and VCS requirements (with their build backends from the index)
+        # into wheels, so everything it leaves in the cache installs offline
+        wheel_cmd = pip_cmd + ["wheel", *common_args, *find_links, "--wheel-dir", str(self.wheel_dir)]
+        report_cmd = pip_cmd + ["install", "--dry-run", "--ignore-installed", "--report", "-", *common_args]
+        
+        def fill_and_install(deps):
+            """Fill the wheel cache for deps, then install them from it"""
+            if not (self._download_resolved(report_cmd + deps) or self._run_silent(wheel_cmd + deps) == 0):
+                return False
+            # Requirements the cache cannot satisfy by name alone, such as VCS URLs, fall back to the index
+            return self._run_silent(offline_cmd + deps) == 0 or self._run_silent(install_cmd + deps) == 0
+        
+        # Offline install first: succeeds without touching PyPI when every wheel is cached
+        if self.use_cache and self._run_silent(offline_cmd + list(dependencies)) == 0:
+            return
+        
+        # Fill the wheel cache in one resolve, then install from it
+        if fill_and_install(list(dependencies)):
+            return
+        
+        if len(dependencies) == 1:
+            raise Exception(f"Failed to install {dependencies[0]}")
+        
+        # Retry one at a time to report which dependency failed
         for dep in dependencies:
-            cmd = [str(python_exe), "-m", "pip", "install", dep, "--quiet", "--no-warn-script-location"]
-            result = self._run_silent(cmd)
-            if result != 0:
+            if not fill_and_install([dep]):
                 raise Exception(f"Failed to install {dep}")
+        # Each installs alone, so the combined resolve failed on how they constrain each other
+        self.printer.warning("Dependencies were installed one at a time; pip could not resolve them together")
+    
+    def _download_resolved(self, report_cmd):
+        """Resolve with pip's install report, then fetch every archive in parallel; False to fall back"""
+        import json
+        from concurrent.futures import ThreadPoolExecutor
+        
+        returncode, report = self._run_capture(report_cmd)
+        if returncode != 0:
+            return False
+        
+        try:
+            download_infos = [item['download_info'] for item in json.loads(report)['install']]
+        except (ValueError, KeyError, TypeError):
+            return False
+        # Only remote wheels can be fetched directly; sdists, VCS and local sources are built by pip wheel
+        if not all(
+            'archive_info' in info and info['url'].startswith(('https://', 'http://'))
+            and info['url'].split('#', 1)[0].endswith('.whl')
+            for info in download_infos
+        ):
+            return False
+        downloads = [(info['url'], info['archive_info'].get('hashes', {})) for info in download_infos]
+        
+        self.wheel_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            with ThreadPoolExecutor(max_workers=self.WHEEL_DOWNLOAD_WORKERS) as executor:
+                list(executor.map(lambda download: self._fetch_archive(*download), downloads))
+        except Exception:
+            return False
+        return True
+    
+    def _fetch_archive(self, url, hashes):
+        """Download one distribution into the wheel cache, verifying its sha256 when known"""
+        import hashlib
+        import urllib.parse
+        
+        target_path = self.wheel_dir / urllib.parse.unquote(urllib.parse.urlsplit(url).path.rsplit('/', 1)[-1])
+        if target_path.exists():
+            return
+        
+        temp_path = self._temp_path(target_path)
+        try:
+            digest = hashlib.sha256()
+            with self._open_url(url) as response, open(temp_path, 'wb') as f:
+                while chunk := response.read(self.DOWNLOAD_BUFFER_SIZE):
+                    digest.update(chunk)
+                    f.write(chunk)
+            if 'sha256' in hashes and digest.hexdigest() != hashes['sha256']:
+                raise Exception(f"hash mismatch for {target_path.name}")
+            os.replace(temp_path, target_path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+    
+    @staticmethod
+    def _temp_path(target_path):
+        """Create a uniquely named file beside target_path, so concurrent writers never share one"""
+        import tempfile
+        
+        fd, temp_path = tempfile.mkstemp(prefix=f".{target_path.name}.", suffix=".part", dir=target_path.parent)
+        os.close(fd)
+        return Path(temp_path)
     
-    def _run_silent(self, cmd):
-        """Run command silently"""
+    def _run_capture(self, cmd):
+        """Run command without a window, returning (return code, stdout text)"""
+        import subprocess
+        
+        result = subprocess.run(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=False, text=True,
+            **self._hidden_window_args()
+        )
+        return result.returncode, result.stdout
+    
+    @staticmethod
+    def _hidden_window_args():
+        """subprocess keyword arguments that keep child consoles hidden on Windows"""
+        import subprocess
+        
         startupinfo = subprocess.STARTUPINFO()
         startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
         startupinfo.wShowWindow = subprocess.SW_HIDE
+        return {'startupinfo': startupinfo, 'creationflags': subprocess.CREATE_NO_WINDOW}
+    
+    def _run_silent(self, cmd, input=None):
+        """Run command silently, optionally feeding input bytes to its stdin"""
+        import subprocess
         
-        with open(os.devnull, 'w') as devnull:
-            result = subprocess.run(
-                cmd, stdout=devnull, stderr=devnull, check=False,
-                startupinfo=startupinfo, creationflags=subprocess.CREATE_NO_WINDOW
-            )
-            return result.returncode
\ No newline at end of file
+        # DEVNULL lets the OS discard output without opening a file per call
+        result = subprocess.run(
+            cmd, input=input, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False,
+            **self._hidden_window_args()
+        )
+        return result.returncode
\ No newline at end of file
@@ -1,66 +1,99 @@
 import sys
 import argparse
-from .core import ProjectBundler
-from .utils import StylePrinter
+from .utils import PRINTER, PythonManager
+
+
+# Built once and written in a single call; each print() would flush separately on Windows consoles
+HELP_TEXT = """
+pywest - Python Project Bundler for Windows
+
+Usage:
+    pywest                           Show this help information
+    pywest <project_name>            Bundle project as folder (default)
+    pywest <project_name> --zip      Bundle project as ZIP file
+    pywest <project_name> --zstd     Bundle project as .tar.zst file
+    pywest <project> <project> ...   Bundle several projects in parallel
+
+Options:
+    --zip, -z                        Create bundle as ZIP instead of folder
+    --zstd                           Create bundle as .tar.zst (requires zstandard)
+    --compression, -c LEVEL          Compression level (0-9, default: 6)
+    --python VERSION                 Specify Python version (default: 3.12.10)
+    --name, -n NAME                  Custom name for the bundle
+    --force, -f                      Overwrite an existing bundle folder, ZIP or .tar.zst file
+    --jobs, -j N                     Projects to bundle in parallel (default: CPU count)
+
+Project Configuration:
+    PyWest requires a pyproject.toml file in your project directory with
+    the following [tool.pywest] section:
+
+    Example pyproject.toml:
+    [project]
+    name = "my-app"
+    dependencies = [
+        "requests>=2.25.0",
+        "flask>=2.0.0"
+    ]
+
+    [tool.pywest]
+    entry = "myapp.main:main"        # Required: module:function entry point
+    icon = "src/icon.png"             # Optional: path to icon file
+
+Examples:
+    pywest my-project                Bundle 'my-project' as folder
+    pywest my-project --zip          Bundle 'my-project' as ZIP file
+    pywest my-project -n MyApp       Bundle with custom name 'MyApp'
+    pywest my-project -c 9           Bundle with maximum compression
+    pywest app-one app-two -j 2      Bundle two projects at once
+"""
 
 
 class PyWestCLI:
     def __init__(self):
-        self.printer = StylePrinter()
+        self.printer = PRINTER
 
     def create_parser(self):
         """Create command line argument parser"""
         parser = argparse.ArgumentParser(description='pywest - Python Project Bundler for Windows')
-        parser.add_argument('project_name', nargs='?', help='Name of the project directory to bundle')
+        parser.add_argument('project_names', nargs='*', metavar='project_name',
+                           help='Name of the project directory to bundle (several may be given)')
         parser.add_argument('--zip', '-z', action='store_true', help='Create bundle as ZIP instead of folder')
+        parser.add_argument('--zstd', action='store_true',
+                           help='Create bundle as .tar.zst instead of folder (requires zstandard)')
         parser.add_argument('--compression', '-c', type=int, default=6, choices=range(0, 10),
                            help='Compression level (0-9, default: 6). 0=store, 1=fastest, 6=default, 9=best')
-        parser.add_argument('--python', default='3.12.10', 
-                           choices=['3.12.10', '3.11.9'], 
-                           help='Python version to use (default: 3.12.10)')
+        parser.add_argument('--python', default=PythonManager.DEFAULT_VERSION, 
+                           choices=PythonManager.SUPPORTED_VERSIONS, 
+                           help='Python version to use (default: %(default)s)')
         parser.add_argument('--name', '-n', 
                            help='Custom name for the bundle (default: <project_name>_bundle)')
+        parser.add_argument('--force', '-f', action='store_true',
+                           help='Overwrite an existing bundle folder, ZIP or .tar.zst file')
+        parser.add_argument('--jobs', '-j', type=int, default=None,
+                           help='Number of projects to bundle in parallel (default: CPU count)')
         return parser
 
     def print_help_info(self):
         """Print CLI help information"""
-        print("\npywest - Python Project Bundler for Windows\n")
-        print("Usage:")
-        print("    pywest                           Show this help information")
-        print("    pywest <project_name>            Bundle project as folder (default)")
-        print("    pywest <project_name> --zip      Bundle project as ZIP file")
-        print("\nOptions:")
-        print("    --zip, -z                        Create bundle as ZIP instead of folder")
-        print("    --compression, -c LEVEL          Compression level (0-9, default: 6)")
-        print("    --python VERSION                 Specify Python version (default: 3.12.10)")
-        print("    --name, -n NAME                  Custom name for the bundle")
-        print("\nProject Configuration:")
-        print("    PyWest requires a pyproject.toml file in your project directory with")
-        print("    the following [tool.pywest] section:")
-        print("\n    Example pyproject.toml:")
-        print("    [project]")
-        print("    name = \"my-app\"")
-        print("    dependencies = [")
-        print("        \"requests>=2.25.0\",")
-        print("        \"flask>=2.0.0\"")
-        print("    ]")
-        print("\n    [tool.pywest]")
-        print("    entry = \"myapp.main:main\"        # Required: module:function entry point")
-        print("    icon = \"src/icon.png\"             # Optional: path to icon file")
-        print("\nExamples:")
-        print("    pywest my-project                Bundle 'my-project' as folder")
-        print("    pywest my-project --zip          Bundle 'my-project' as ZIP file")
-        print("    pywest my-project -n MyApp       Bundle with custom name 'MyApp'")
-        print("    pywest my-project -c 9           Bundle with maximum compression")
+        sys.stdout.write(HELP_TEXT)
 
     def run(self):
         """Main CLI entry point"""
         parser = self.create_parser()
         args = parser.parse_args()
 
-        if not args.project_name:
+        if not args.project_names:
             self.print_help_info()
             return 0
+        if len(args.project_names) > 1 and args.name:
+            parser.error("--name can only be used when bundling a single project")
+        if args.zip and args.zstd:
+            parser.error("--zip and --zstd cannot be used together")
+        if args.jobs is not None and args.jobs < 1:
+            parser.error("--jobs must be at least 1")
+
+        # Deferred so that showing help does not load the bundling machinery
+        from .core import ProjectBundler
 
         try:
             bundler = ProjectBundler(
@@ -68,8 +101,12 @@ class PyWestCLI:
                 compression_level=args.compression
             )
 
-            bundle_type = 'zip' if args.zip else 'folder'
-            result = bundler.bundle_project(args.project_name, bundle_type, args.name)
+            bundle_type = 'zip' if args.zip else 'zstd' if args.zstd else 'folder'
+            if len(args.project_names) > 1:
+                results = bundler.bundle_projects(args.project_names, bundle_type, args.jobs, args.force)
+                return 0 if all(results.values()) else 1
+            
+            result = bundler.bundle_project(args.project_names[0], bundle_type, args.name, args.force)
 
             return 0 if result else 1
 
@@ -1,3 +1,605 @@
 """
 Tests for pywest package
-"""
\ No newline at end of file
+"""
+import io
+import os
+import json
+import gzip
+import hashlib
+import tarfile
+import random
+import zipfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from pywest import core, sinks
+from pywest.core import ProjectBundler
+from pywest.utils import PythonManager
+from pywest.wcli import PyWestCLI
+from pywest.sinks import FolderSink, TarSink, ZipSink
+
+
+@pytest.fixture
+def source_tree(tmp_path):
+    """Directory tree mixing tiny, compressible, incompressible and pre-compressed files"""
+    rng = random.Random(0)
+    root = tmp_path / "src"
+    files = {
+        "empty.txt": b"",
+        "main.py": b"print('hello')\n" * 200,
+        "pkg/__init__.py": b"",
+        "pkg/module.py": b"def f(x):\n    return x * 2\n" * 5000,
+        "pkg/data/random.bin": rng.randbytes(300 * 1024),
+        "pkg/data/archive.gz": gzip.compress(b"compressed " * 1000),
+        "pkg/data/nested/large.txt": b"0123456789abcdef" * 40 * 1024,
+    }
+    for relative, data in files.items():
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    return root, files
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    """Point PythonManager's ~/.pywest cache at a temporary home"""
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("USERPROFILE", str(home))
+    return home
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Minimal project with a valid [tool.pywest] section"""
+    project = tmp_path / "myapp"
+    project.mkdir()
+    (project / "pyproject.toml").write_text(
+        '[project]\nname = "myapp"\ndependencies = []\n\n[tool.pywest]\nentry = "main:run"\n'
+    )
+    (project / "main.py").write_text("def run():\n    print('hello')\n")
+    return project
+
+
+@pytest.fixture
+def bundler(home, monkeypatch):
+    """ProjectBundler whose Python environment, pip and icon steps are stubbed out"""
+    bundler = ProjectBundler()
+    builds = []
+
+    def setup_environment(python_version, target_dir, link=False):
+        builds.append(target_dir)
+        target_dir.mkdir(parents=True)
+        (target_dir / "python.exe").write_bytes(b"MZ")
+
+    monkeypatch.setattr(bundler.python_manager, "setup_environment", setup_environment)
+    monkeypatch.setattr(bundler.python_manager, "install_dependencies", lambda python_exe, dependencies: None)
+    monkeypatch.setattr(bundler.python_manager, "compile_sources", lambda *args: True)
+    monkeypatch.setattr(bundler, "_process_icon", lambda project_path, config: b"ICO")
+    bundler.builds = builds
+    return bundler
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+@pytest.mark.parametrize("level", [0, 1, 9])
+def test_zip_sink_round_trip(source_tree, monkeypatch, level, workers):
+    root, files = source_tree
+    # Small enough that the 640 KiB file takes the streaming path
+    monkeypatch.setattr(sinks, "LARGE_FILE_SIZE", 512 * 1024)
+
+    compression = zipfile.ZIP_STORED if level == 0 else zipfile.ZIP_DEFLATED
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', compression, compresslevel=level) as zipf:
+        sink = ZipSink(zipf, "bundle", workers=workers)
+        sink.add_tree(root, "bin")
+        sink.add_file(root / "main.py", "main.py")
+        sink.add_bytes("run.bat", b"@echo off\r\n")
+
+    with zipfile.ZipFile(buffer) as zipf:
+        assert zipf.testzip() is None
+        expected = {f"bundle/bin/{relative}": data for relative, data in files.items()}
+        expected["bundle/main.py"] = files["main.py"]
+        expected["bundle/run.bat"] = b"@echo off\r\n"
+        assert sorted(zipf.namelist()) == sorted(expected)
+        for name, data in expected.items():
+            assert zipf.read(name) == data
+        # Pre-compressed payloads are stored rather than deflated a second time
+        assert zipf.getinfo("bundle/bin/pkg/data/archive.gz").compress_type == zipfile.ZIP_STORED
+
+
+# 1970 and 2200 both fall outside the 1980-2107 range a ZIP timestamp can hold
+@pytest.mark.parametrize("mtime, date_time", [
+    (0, (1980, 1, 1, 0, 0, 0)),
+    (7258118400, (2107, 12, 31, 23, 59, 59)),
+])
+def test_zipinfo_from_stat_clamps_mtime(mtime, date_time):
+    st = os.stat_result((0o100644, 0, 0, 1, 0, 0, 5, mtime, mtime, mtime))
+    zinfo = sinks._zipinfo_from_stat("bundle/file.txt", st)
+    assert zinfo.date_time == date_time
+    assert zinfo.file_size == 5
+    assert zinfo.external_attr >> 16 == 0o100644
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_zip_sink_accepts_out_of_range_mtimes(tmp_path, workers):
+    source = tmp_path / "src"
+    source.mkdir()
+    for name in ("old.txt", "new.txt"):
+        (source / name).write_bytes(b"data " * 100)
+    os.utime(source / "old.txt", (0, 0))
+    os.utime(source / "new.txt", (7258118400,) * 2)
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as zipf:
+        ZipSink(zipf, "bundle", workers=workers).add_tree(source, "bin")
+        ZipSink(zipf, "bundle").add_file(source / "old.txt", "old.txt")
+
+    with zipfile.ZipFile(buffer) as zipf:
+        assert zipf.testzip() is None
+        assert zipf.getinfo("bundle/bin/old.txt").date_time[0] == 1980
+        assert zipf.getinfo("bundle/bin/new.txt").date_time[0] == 2107
+        assert zipf.getinfo("bundle/old.txt").date_time[0] == 1980
+
+
+@pytest.mark.parametrize("value, expected", [(None, 3), ("", 3), ("0", 3), ("7", 7), (" 2 ", 2)])
+def test_workers_from_env(monkeypatch, capsys, value, expected):
+    if value is None:
+        monkeypatch.delenv("PYWEST_TEST_WORKERS", raising=False)
+    else:
+        monkeypatch.setenv("PYWEST_TEST_WORKERS", value)
+    assert sinks._workers_from_env("PYWEST_TEST_WORKERS", 3) == expected
+    assert "Ignoring" not in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("value", ["abc", "-2", "1.5"])
+def test_workers_from_env_warns_on_invalid_values(monkeypatch, capsys, value):
+    monkeypatch.setenv("PYWEST_TEST_WORKERS", value)
+    assert sinks._workers_from_env("PYWEST_TEST_WORKERS", 3) == 3
+    assert "PYWEST_TEST_WORKERS" in capsys.readouterr().out
+
+
+def test_zipfile_internals_used_by_zip_sink():
+    # ZipSink._write_compressed and _stream_file rely on these; a CPython change must fail here, not in a bundle
+    with zipfile.ZipFile(io.BytesIO(), 'w') as zipf:
+        missing = [name for name in sinks._ZIPFILE_INTERNALS if not hasattr(zipf, name)]
+    assert not missing, f"zipfile internals changed: {missing}"
+    assert sinks._ZIPINFO_LEVEL in zipfile.ZipInfo.__slots__
+
+
+def test_folder_sink_round_trip(source_tree, tmp_path):
+    root, files = source_tree
+    target = tmp_path / "out"
+    sink = FolderSink(target)
+    sink.add_tree(root, "bin")
+    sink.add_file(root / "main.py", "main.py")
+    sink.add_bytes("run.bat", b"@echo off\r\n")
+
+    for relative, data in files.items():
+        assert (target / "bin" / relative).read_bytes() == data
+    assert (target / "main.py").read_bytes() == files["main.py"]
+    assert (target / "run.bat").read_bytes() == b"@echo off\r\n"
+
+
+def test_folder_sink_honours_ignore(source_tree, tmp_path):
+    root, files = source_tree
+    target = tmp_path / "out"
+    ignore = lambda directory, names: {name for name in names if name == "data"}
+    FolderSink(target).add_tree(root, "bin", ignore=ignore)
+
+    assert (target / "bin" / "pkg" / "module.py").read_bytes() == files["pkg/module.py"]
+    assert not (target / "bin" / "pkg" / "data").exists()
+
+
+def test_tar_sink_round_trip(source_tree):
+    root, files = source_tree
+    buffer = io.BytesIO()
+    # Stream mode, as the .tar.zst builder writes it through a zstd stream
+    with tarfile.open(fileobj=buffer, mode='w|') as tar:
+        sink = TarSink(tar, "bundle")
+        sink.add_tree(root, "bin")
+        sink.add_file(root / "main.py", "main.py")
+        sink.add_bytes("run.bat", b"@echo off\r\n")
+
+    buffer.seek(0)
+    with tarfile.open(fileobj=buffer, mode='r') as tar:
+        expected = {f"bundle/bin/{relative}": data for relative, data in files.items()}
+        expected["bundle/main.py"] = files["main.py"]
+        expected["bundle/run.bat"] = b"@echo off\r\n"
+        assert sorted(tar.getnames()) == sorted(expected)
+        for name, data in expected.items():
+            assert tar.extractfile(name).read() == data
+
+
+def test_bundle_signature_tracks_changes(home, tmp_path):
+    project = tmp_path / "myapp"
+    (project / "pkg").mkdir(parents=True)
+    (project / "main.py").write_text("print('hello')\n")
+    (project / "pkg" / "util.py").write_text("VALUE = 1\n")
+    config = {'name': 'myapp', 'entry': 'main.py'}
+
+    def signature_of(bundler, config, bundle_type):
+        return bundler._bundle_signature(config, bundle_type, bundler._project_files(project))
+
+    bundler = ProjectBundler()
+    signature = signature_of(bundler, config, 'zip')
+    assert signature_of(bundler, config, 'zip') == signature
+
+    # Ignored files and compiled caches do not force a rebuild
+    (project / "pkg" / "__pycache__").mkdir()
+    (project / "pkg" / "__pycache__" / "util.cpython-312.pyc").write_bytes(b"\0" * 16)
+    (project / ".git").mkdir()
+    (project / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+    assert signature_of(bundler, config, 'zip') == signature
+
+    # Bundle type, settings and file contents all change the signature
+    assert signature_of(bundler, config, 'folder') != signature
+    assert signature_of(bundler, {**config, 'entry': 'other.py'}, 'zip') != signature
+    assert signature_of(ProjectBundler(compression_level=9), config, 'zip') != signature
+
+    (project / "pkg" / "util.py").write_text("VALUE = 2\n")
+    changed = signature_of(bundler, config, 'zip')
+    assert changed != signature
+
+    (project / "pkg" / "new.py").write_text("")
+    assert signature_of(bundler, config, 'zip') != changed
+
+    # PythonManager created its cache under the temporary home
+    assert (home / ".pywest").is_dir()
+
+
+@pytest.mark.parametrize("bundle_type", ["folder", "zip"])
+def test_unchanged_bundle_is_up_to_date(bundler, project, bundle_type):
+    output = bundler.bundle_project(str(project), bundle_type)
+    manifest = bundler._manifest_path(output, bundle_type)
+    assert manifest.exists()
+
+    assert bundler.bundle_project(str(project), bundle_type) == output
+    assert len(bundler.builds) == 1
+
+    # A changed project is refused without --force, and the old bundle keeps its manifest
+    (project / "main.py").write_text("def run():\n    print('changed')\n")
+    with pytest.raises(FileExistsError):
+        bundler.bundle_project(str(project), bundle_type)
+    assert manifest.exists()
+    assert len(bundler.builds) == 1
+
+    # Reverting the change makes the untouched bundle current again
+    (project / "main.py").write_text("def run():\n    print('hello')\n")
+    assert bundler.bundle_project(str(project), bundle_type) == output
+    assert len(bundler.builds) == 1
+
+
+@pytest.mark.parametrize("bundle_type", ["folder", "zip"])
+def test_force_rebuilds_and_refreshes_manifest(bundler, project, bundle_type):
+    output = bundler.bundle_project(str(project), bundle_type)
+    manifest = bundler._manifest_path(output, bundle_type)
+    before = manifest.read_text()
+
+    # --force rebuilds even when nothing changed
+    bundler.bundle_project(str(project), bundle_type, force=True)
+    assert len(bundler.builds) == 2
+    assert manifest.read_text() == before
+
+    (project / "main.py").write_text("def run():\n    print('changed')\n")
+    bundler.bundle_project(str(project), bundle_type, force=True)
+    assert len(bundler.builds) == 3
+    assert manifest.read_text() != before
+
+    # The forced rebuild is recorded, so the next plain run is up to date
+    bundler.bundle_project(str(project), bundle_type)
+    assert len(bundler.builds) == 3
+
+
+def test_preallocate_does_not_zero_fill_without_fallocate(tmp_path, monkeypatch):
+    # On Windows truncate() would write the extension out as zeros, so nothing is reserved there
+    monkeypatch.setattr(core, "CAN_PREALLOCATE", False)
+    with open(tmp_path / "bundle.zip", 'w+b') as f:
+        core._preallocate(f, 1024 * 1024)
+        assert f.seek(0, io.SEEK_END) == 0
+
+
+@pytest.fixture
+def embeddable():
+    """Fake embeddable archive shaped like the real one: a few dozen members, a few large"""
+    rng = random.Random(1)
+    files = {"python.exe": b"MZ" * 50000, "python312.dll": rng.randbytes(2 * 1024 * 1024),
+             "python312.zip": rng.randbytes(1024 * 1024), "python312._pth": b"python312.zip\n.\n#import site\n"}
+    files.update({f"_module{i}.pyd": rng.randbytes(rng.randrange(1, 200 * 1024)) for i in range(30)})
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        for name, data in files.items():
+            zipf.writestr(name, data)
+    return buffer.getvalue(), files
+
+
+@pytest.mark.parametrize("from_path", [False, True])
+def test_extract_python(home, tmp_path, embeddable, from_path):
+    archive, files = embeddable
+    source = archive
+    if from_path:
+        source = tmp_path / "embed.zip"
+        source.write_bytes(archive)
+    target = tmp_path / "bin"
+    PythonManager().extract_python(source, target)
+
+    for name, data in files.items():
+        assert (target / name).read_bytes() == data
+    assert (target / "pythonw.exe").read_bytes() == files["python.exe"]
+
+
+def test_balance_members_spreads_large_members(embeddable):
+    with zipfile.ZipFile(io.BytesIO(embeddable[0])) as zipf:
+        members = zipf.infolist()
+    buckets = PythonManager._balance_members(members, 4)
+
+    assert len(buckets) == 4
+    assert sorted(member.filename for bucket in buckets for member in bucket) == sorted(embeddable[1])
+    loads = sorted(sum(member.file_size for member in bucket) for bucket in buckets)
+    # No worker ends up with more than the others plus one member's worth of work
+    assert loads[-1] - loads[0] <= max(member.file_size for member in members)
+    # Never more groups than members, and never zero groups
+    assert len(PythonManager._balance_members(members[:2], 8)) == 2
+    assert PythonManager._balance_members([], 4) == [[]]
+
+
+def test_project_tree_is_listed_once_per_bundle(bundler, project, monkeypatch):
+    (project / "pkg").mkdir()
+    (project / "pkg" / "util.py").write_text("VALUE = 1\n")
+    listings, compiled = [], []
+    project_files = bundler._project_files
+    monkeypatch.setattr(bundler, "_project_files", lambda path: listings.append(path) or project_files(path))
+    monkeypatch.setattr(bundler.python_manager, "compile_sources",
+                        lambda python_exe, source_root, relative_paths, output_root: compiled.extend(relative_paths))
+
+    bundler.bundle_project(str(project), 'zip')
+    assert len(listings) == 1
+    assert sorted(compiled) == ["main.py", "pkg/util.py"]
+
+
+@pytest.mark.parametrize("bundle_type", ["folder", "zip", "zstd"])
+def test_existing_output_needs_force(bundler, project, bundle_type):
+    if bundle_type == "zstd":
+        pytest.importorskip("zstandard")
+    output = project.parent / f"myapp_bundle{ProjectBundler.BUNDLE_EXTENSIONS[bundle_type]}"
+    if bundle_type == "folder":
+        output.mkdir()
+        (output / "keep.txt").write_text("not a pywest bundle")
+    else:
+        output.write_bytes(b"not a pywest bundle")
+
+    with pytest.raises(FileExistsError, match="--force"):
+        bundler.bundle_project(str(project), bundle_type)
+    assert not bundler.builds
+    if bundle_type == "folder":
+        assert (output / "keep.txt").read_text() == "not a pywest bundle"
+    else:
+        assert output.read_bytes() == b"not a pywest bundle"
+
+    assert bundler.bundle_project(str(project), bundle_type, force=True) == output
+    if bundle_type == "folder":
+        assert not (output / "keep.txt").exists()
+        assert (output / "run.bat").exists()
+    else:
+        assert output.read_bytes() != b"not a pywest bundle"
+    if bundle_type == "zip":
+        with zipfile.ZipFile(output) as zipf:
+            assert zipf.testzip() is None
+            assert "myapp_bundle/main.py" in zipf.namelist()
+    if bundle_type == "zstd":
+        import zstandard
+        with zstandard.ZstdDecompressor().stream_reader(output.open('rb')) as stream:
+            with tarfile.open(fileobj=stream, mode='r|') as tar:
+                assert "myapp_bundle/main.py" in tar.getnames()
+
+
+def test_cli_force_flag():
+    parser = PyWestCLI().create_parser()
+    assert parser.parse_args(["app", "--zstd", "-f"]).force
+    assert not parser.parse_args(["app", "--zstd"]).force
+
+
+class _EmbedHandler(BaseHTTPRequestHandler):
+    """Serves server.payload with ETag, Range and If-None-Match support"""
+
+    def do_GET(self):
+        server = self.server
+        byte_range = self.headers.get('Range')
+        server.requests.append(byte_range)
+        if self.headers.get('If-None-Match') == server.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        body, status = server.payload, 200
+        if byte_range and server.mode != "ignore-range":
+            lo, hi = map(int, byte_range.removeprefix("bytes=").split("-"))
+            if lo > 0 and server.mode == "fail-segments":
+                self.send_error(500)
+                return
+            body, status = server.payload[lo:hi + 1], 206
+        self.send_response(status)
+        if status == 206:
+            self.send_header('Content-Range', f"bytes {lo}-{lo + len(body) - 1}/{len(server.payload)}")
+        self.send_header('ETag', server.etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def embed_server(home, monkeypatch):
+    """Local HTTP server standing in for python.org, with small segments and no retry delays"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _EmbedHandler)
+    server.payload = random.Random(2).randbytes(700 * 1024)
+    server.etag = '"v1"'
+    server.mode = "normal"
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+
+    monkeypatch.setattr(PythonManager, "BASE_URL", f"http://127.0.0.1:{server.server_address[1]}")
+    monkeypatch.setattr(PythonManager, "MIN_SEGMENT_SIZE", 64 * 1024)
+    monkeypatch.setattr(PythonManager, "DOWNLOAD_RETRIES", 0)
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_download_segmented(embed_server):
+    data, etag = PythonManager()._fetch_python(PythonManager.DEFAULT_VERSION)
+    assert data == embed_server.payload
+    assert etag == embed_server.etag
+    # The probe range plus several parallel segments, never a whole-file GET
+    assert len(embed_server.requests) > 2
+    assert all(request is not None for request in embed_server.requests)
+
+
+def test_download_falls_back_to_single_get(embed_server):
+    embed_server.mode = "fail-segments"
+    data, etag = PythonManager()._fetch_python(PythonManager.DEFAULT_VERSION)
+    assert data == embed_server.payload
+    assert embed_server.requests[-1] is None
+
+
+def test_download_with_range_ignored(embed_server):
+    embed_server.mode = "ignore-range"
+    data, _ = PythonManager()._fetch_python(PythonManager.DEFAULT_VERSION)
+    assert data == embed_server.payload
+    assert len(embed_server.requests) == 1
+
+
+def test_cached_embeddable_revalidates_by_etag(embed_server):
+    manager = PythonManager()
+    manager._store_python(PythonManager.DEFAULT_VERSION, *manager._fetch_python(PythonManager.DEFAULT_VERSION))
+    requests = len(embed_server.requests)
+
+    # Unchanged on the server: 304, keep the cache
+    assert manager._fetch_python(PythonManager.DEFAULT_VERSION) is None
+    assert len(embed_server.requests) == requests + 1
+
+    # Changed on the server: downloaded again
+    embed_server.payload = embed_server.payload[::-1]
+    embed_server.etag = '"v2"'
+    data, etag = manager._fetch_python(PythonManager.DEFAULT_VERSION)
+    assert (data, etag) == (embed_server.payload, '"v2"')
+
+
+class _FakePip:
+    """Stands in for the bundled pip, recording each call as (action, requirements)"""
+
+    REQUIREMENTS = {"alpha", "beta", "alpha @ git+https://example.invalid/alpha"}
+
+    def __init__(self, manager, monkeypatch, outcome, report=None):
+        self.calls = []
+        self.outcome = outcome
+        self.report = report
+        monkeypatch.setattr(manager, "_run_silent", self.run)
+        monkeypatch.setattr(manager, "_run_capture", self.capture)
+
+    @staticmethod
+    def _parse(cmd):
+        action = cmd[3]
+        if action == "install" and "--dry-run" in cmd:
+            action = "report"
+        elif action == "install":
+            action = "offline" if "--no-index" in cmd else "online"
+        return action, [arg for arg in cmd[4:] if arg in _FakePip.REQUIREMENTS]
+
+    def run(self, cmd, input=None):
+        action, requirements = self._parse(cmd)
+        self.calls.append((action, requirements))
+        return 0 if self.outcome(action, requirements) else 1
+
+    def capture(self, cmd):
+        self.calls.append(self._parse(cmd))
+        return (0, json.dumps(self.report)) if self.report is not None else (1, "")
+
+    @property
+    def actions(self):
+        return [action for action, _ in self.calls]
+
+
+def test_install_uses_cached_wheels_offline(home, monkeypatch):
+    manager = PythonManager()
+    pip = _FakePip(manager, monkeypatch, lambda action, requirements: action == "offline")
+    manager.install_dependencies("python.exe", ["alpha", "beta"])
+    assert pip.calls == [("offline", ["alpha", "beta"])]
+
+
+def test_install_builds_sdists_with_pip_wheel(home, monkeypatch):
+    manager = PythonManager()
+    sdist = {"install": [{"download_info": {"url": "https://files.example/alpha-1.0.tar.gz", "archive_info": {}}}]}
+    # Offline installs only succeed once pip wheel has filled the cache
+    pip = _FakePip(manager, monkeypatch, lambda action, requirements: action == "wheel" or (
+        action == "offline" and "wheel" in pip.actions), report=sdist)
+    manager.install_dependencies("python.exe", ["alpha"])
+    assert pip.actions == ["offline", "report", "wheel", "offline"]
+
+
+def test_install_falls_back_to_index_for_vcs_requirements(home, monkeypatch):
+    manager = PythonManager()
+    vcs = "alpha @ git+https://example.invalid/alpha"
+    pip = _FakePip(manager, monkeypatch, lambda action, requirements: action in ("wheel", "online"))
+    manager.install_dependencies("python.exe", [vcs])
+    assert pip.actions == ["offline", "report", "wheel", "offline", "online"]
+
+
+def test_install_fetches_resolved_wheels_directly(embed_server, monkeypatch):
+    manager = PythonManager()
+    url = f"{PythonManager.BASE_URL}/packages/alpha-1.0-py3-none-any.whl"
+    digest = hashlib.sha256(embed_server.payload).hexdigest()
+    report = {"install": [{"download_info": {"url": url, "archive_info": {"hashes": {"sha256": digest}}}}]}
+    cached = manager.wheel_dir / "alpha-1.0-py3-none-any.whl"
+    pip = _FakePip(manager, monkeypatch, lambda action, requirements: action == "offline" and cached.exists(),
+                   report=report)
+
+    manager.install_dependencies("python.exe", ["alpha"])
+    assert pip.actions == ["offline", "report", "offline"]
+    assert cached.read_bytes() == embed_server.payload
+
+
+def test_install_rejects_wheels_with_a_wrong_hash(embed_server, monkeypatch):
+    manager = PythonManager()
+    url = f"{PythonManager.BASE_URL}/packages/alpha-1.0-py3-none-any.whl"
+    report = {"install": [{"download_info": {"url": url, "archive_info": {"hashes": {"sha256": "0" * 64}}}}]}
+    pip = _FakePip(manager, monkeypatch, lambda action, requirements: action == "wheel" or (
+        action == "offline" and "wheel" in pip.actions), report=report)
+
+    manager.install_dependencies("python.exe", ["alpha"])
+    # The bad download is discarded and pip wheel fills the cache instead
+    assert pip.actions == ["offline", "report", "wheel", "offline"]
+    assert list(manager.wheel_dir.iterdir()) == []
+
+
+def test_install_retries_dependencies_one_at_a_time(home, monkeypatch):
+    manager = PythonManager()
+    # Each requirement installs alone, but not together
+    pip = _FakePip(manager, monkeypatch, lambda action, requirements: action == "wheel" and len(requirements) == 1
+                   or action == "offline" and len(requirements) == 1)
+    manager.install_dependencies("python.exe", ["alpha", "beta"])
+    assert pip.calls[-2:] == [("wheel", ["beta"]), ("offline", ["beta"])]
+
+
+def test_install_reports_the_failing_dependency(home, monkeypatch):
+    manager = PythonManager()
+    pip = _FakePip(manager, monkeypatch, lambda action, requirements: requirements == ["alpha"])
+    with pytest.raises(Exception, match="Failed to install beta"):
+        manager.install_dependencies("python.exe", ["alpha", "beta"])
+    with pytest.raises(Exception, match="Failed to install beta"):
+        manager.install_dependencies("python.exe", ["beta"])
+
+
+def test_install_without_cache_skips_the_offline_attempt(home, monkeypatch):
+    monkeypatch.setenv("PYWEST_NO_CACHE", "1")
+    manager = PythonManager()
+    pip = _FakePip(manager, monkeypatch, lambda action, requirements: action in ("wheel", "offline"))
+    manager.install_dependencies("python.exe", ["alpha"])
+    assert pip.actions == ["report", "wheel", "offline"]